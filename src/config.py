@@ -36,10 +36,13 @@ class Config:
     
     # Recording Configuration
     MAX_CONCURRENT_RECORDINGS: int = int(os.getenv('MAX_CONCURRENT_RECORDINGS', '3'))
+    SCHEDULE_LOOKAHEAD_MINUTES: int = int(os.getenv('SCHEDULE_LOOKAHEAD_MINUTES', '60'))
     RECORDINGS_DIR: str = os.getenv('RECORDINGS_DIR', 'recordings')
     
     # File Transfer Configuration
     CLEANUP_AFTER_TRANSFER: bool = os.getenv('CLEANUP_AFTER_TRANSFER', 'true').lower() == 'true'
+    MAX_CONCURRENT_TRANSFERS: int = int(os.getenv('MAX_CONCURRENT_TRANSFERS', '4'))
+    MAX_TRANSFERS_PER_HOST: int = int(os.getenv('MAX_TRANSFERS_PER_HOST', '4'))
     
     # Artwork Configuration
     ARTWORK_DIR: str = os.getenv('ARTWORK_DIR', 'artwork')
@@ -54,6 +57,10 @@ class Config:
     
     # FFmpeg Configuration
     FFMPEG_PATH: str = os.getenv('FFMPEG_PATH', 'ffmpeg')
+    FFMPEG_LOGLEVEL: str = os.getenv('FFMPEG_LOGLEVEL', 'error')
+    FFMPEG_PROBESIZE: str = os.getenv('FFMPEG_PROBESIZE', '32768')
+    FFMPEG_ANALYZEDURATION: str = os.getenv('FFMPEG_ANALYZEDURATION', '0')  # microseconds
+    FFMPEG_RW_TIMEOUT: str = os.getenv('FFMPEG_RW_TIMEOUT', '15000000')  # microseconds
     
     @classmethod
     def ensure_directories(cls) -> None:
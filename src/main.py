@@ -330,6 +330,20 @@ def initialize_workflow_services():
             lambda: workflow_coordinator.stop_all_sessions()
         )
         
+        # Shared SCP service used by recording sessions; shut down first so
+        # transfers waiting to retry don't hold up the other services
+        from src.services.scp_transfer_service import get_scp_transfer_service
+        scp_transfer_service = get_scp_transfer_service()
+        service_container.register_service(
+            'scp_transfer',
+            scp_transfer_service,
+            lambda: scp_transfer_service.shutdown()
+        )
+        
+        # Page FFmpeg in off the startup path, before the first recording needs it
+        from src.services.stream_recorder import warm_up_ffmpeg
+        threading.Thread(target=warm_up_ffmpeg, name="ffmpeg-warm-up", daemon=True).start()
+        
         # Start background task for automatic backups
         start_backup_scheduler(workflow_coordinator)
         
@@ -104,9 +104,9 @@ class RecordingSchedule(Base):
         
         return next_run
     
-    def update_next_run_time(self):
-        """Update the next_run_time field based on current time."""
-        self.next_run_time = self.calculate_next_run_time()
+    def update_next_run_time(self, base: Optional[datetime] = None):
+        """Update the next_run_time field based on the given time (defaults to now)."""
+        self.next_run_time = self.calculate_next_run_time(base)
     
     def __repr__(self):
         return f"<RecordingSchedule(id={self.id}, cron='{self.cron_expression}', duration={self.duration_minutes}min)>"
@@ -157,6 +157,51 @@ class ScheduleRepository(BaseRepository):
         with self.get_session() as session:
             return session.query(RecordingSchedule).filter(RecordingSchedule.id == schedule_id).first()
     
+    def get_with_config(self, schedule_id: int) -> Optional[RecordingSchedule]:
+        """Get recording schedule by ID with its stream configuration loaded in the same query."""
+        with self.get_session() as session:
+            from sqlalchemy.orm import joinedload
+            return session.query(RecordingSchedule)\
+                         .options(joinedload(RecordingSchedule.stream_config))\
+                         .filter(RecordingSchedule.id == schedule_id)\
+                         .first()
+    
+    def record_run(
+        self,
+        schedule_id: int,
+        start_time: datetime,
+        next_run_time: Optional[datetime] = None
+    ) -> int:
+        """
+        Create the session for a schedule run and stamp the schedule's run times in one transaction.
+        
+        Returns:
+            ID of the new recording session
+        """
+        with self.get_session() as session:
+            try:
+                db_session = RecordingSession(
+                    schedule_id=schedule_id,
+                    start_time=start_time,
+                    status=RecordingStatus.SCHEDULED
+                )
+                session.add(db_session)
+                session.flush()
+                session_id = db_session.id
+                
+                schedule_values = {'last_run_time': start_time, 'updated_at': start_time}
+                if next_run_time is not None:
+                    schedule_values['next_run_time'] = next_run_time
+                session.query(RecordingSchedule)\
+                       .filter(RecordingSchedule.id == schedule_id)\
+                       .update(schedule_values, synchronize_session=False)
+                
+                session.commit()
+                return session_id
+            except IntegrityError as e:
+                session.rollback()
+                raise ValueError(f"Database error: {str(e)}")
+    
     def get_all(self, skip: int = 0, limit: int = 100) -> List[RecordingSchedule]:
         """Get all recording schedules with pagination."""
         with self.get_session() as session:
@@ -184,6 +229,33 @@ class ScheduleRepository(BaseRepository):
                          .order_by(RecordingSchedule.next_run_time.asc())\
                          .all()
     
+    def get_active_schedule_ids(self) -> List[int]:
+        """Get IDs of all active recording schedules."""
+        with self.get_session() as session:
+            rows = session.query(RecordingSchedule.id)\
+                          .filter(RecordingSchedule.is_active == True)\
+                          .all()
+            return [row.id for row in rows]
+    
+    def get_due_within(self, window: timedelta) -> List[RecordingSchedule]:
+        """Get active schedules whose next run falls before now + window."""
+        from ..utils.timezone_utils import get_local_now
+        horizon = get_local_now() + window
+        
+        with self.get_session() as session:
+            from sqlalchemy.orm import joinedload
+            return session.query(RecordingSchedule)\
+                         .options(joinedload(RecordingSchedule.stream_config))\
+                         .filter(and_(
+                             RecordingSchedule.is_active == True,
+                             or_(
+                                 RecordingSchedule.next_run_time == None,
+                                 RecordingSchedule.next_run_time <= horizon
+                             )
+                         ))\
+                         .order_by(RecordingSchedule.next_run_time.asc())\
+                         .all()
+    
     def get_due_schedules(self, current_time: datetime) -> List[RecordingSchedule]:
         """Get schedules that are due for execution."""
         with self.get_session() as session:
@@ -437,6 +509,59 @@ class SessionRepository(BaseRepository):
             session.refresh(db_session)
             return db_session
     
+    def complete_and_fetch_transfer_context(
+        self,
+        session_id: int,
+        end_time: datetime,
+        status: RecordingStatus,
+        output_file: Optional[str] = None,
+        size: Optional[int] = None,
+        error_message: Optional[str] = None
+    ) -> Optional[RecordingSession]:
+        """
+        Record a session's outcome and return it with its schedule and stream configuration.
+        
+        The session, schedule and stream configuration are loaded in one joined
+        query and the outcome is written in the same transaction.
+        
+        Args:
+            session_id: Session ID that finished
+            end_time: When the recording ended
+            status: Final recording status
+            output_file: Path to the recorded file, if any
+            size: Size of the recorded file in bytes, if known
+            error_message: Error to record when the session has none yet
+            
+        Returns:
+            Detached session with schedule.stream_config loaded, or None if not found
+        """
+        with self.get_session() as session:
+            from sqlalchemy.orm import joinedload
+            db_session = session.query(RecordingSession)\
+                               .options(joinedload(RecordingSession.schedule)
+                                        .joinedload(RecordingSchedule.stream_config))\
+                               .filter(RecordingSession.id == session_id)\
+                               .first()
+            if not db_session:
+                return None
+            
+            db_session.end_time = end_time
+            db_session.status = status
+            if output_file:
+                db_session.output_file_path = output_file
+            if size is not None:
+                db_session.file_size_bytes = size
+            if error_message and not db_session.error_message:
+                db_session.error_message = error_message
+            db_session.updated_at = end_time
+            
+            # Detach the loaded rows so the commit doesn't expire them and
+            # force a reload when the caller reads the transfer details
+            session.flush()
+            session.expunge_all()
+            session.commit()
+            return db_session
+    
     def delete(self, session_id: int) -> bool:
         """Delete recording session."""
         with self.get_session() as session:
@@ -6,7 +6,7 @@ Contains business logic and workflow orchestration components.
 from .stream_recorder import StreamRecorder, RecordingStatus
 from .audio_processor import AudioProcessor
 from .recording_session_manager import RecordingSessionManager, WorkflowStage
-from .scp_transfer_service import SCPTransferService, TransferResult, TransferStatus, SCPConfig
+from .scp_transfer_service import SCPTransferService, TransferResult, TransferStatus, SCPConfig, get_scp_transfer_service
 from .transfer_queue import TransferQueue, QueuedTransfer
 
 __all__ = [
@@ -19,6 +19,7 @@ __all__ = [
     'TransferResult',
     'TransferStatus',
     'SCPConfig',
+    'get_scp_transfer_service',
     'TransferQueue',
     'QueuedTransfer'
 ]
\ No newline at end of file
@@ -34,7 +34,8 @@ class AudioProcessor:
         output_path: str,
         metadata: Dict[str, Any],
         artwork_path: Optional[str] = None,
-        recording_date: Optional[datetime] = None
+        recording_date: Optional[datetime] = None,
+        move_input: bool = False
     ) -> bool:
         """
         Process audio file: convert to MP3 and embed metadata.
@@ -45,6 +46,7 @@ class AudioProcessor:
             metadata: Dictionary containing metadata (artist, album, album_artist)
             artwork_path: Optional path to artwork image file
             recording_date: Date of recording (defaults to current date)
+            move_input: Rename an MP3 input into place instead of copying it
         
         Returns:
             True if processing successful, False otherwise
@@ -54,7 +56,7 @@ class AudioProcessor:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             
             # Convert to MP3 if needed
-            if not self._convert_to_mp3(input_path, output_path):
+            if not self._convert_to_mp3(input_path, output_path, move_input=move_input):
                 return False
             
             # Calculate and embed metadata
@@ -68,13 +70,14 @@ class AudioProcessor:
             self.logger.error(f"Error processing audio file: {e}")
             return False
     
-    def _convert_to_mp3(self, input_path: str, output_path: str) -> bool:
+    def _convert_to_mp3(self, input_path: str, output_path: str, move_input: bool = False) -> bool:
         """
         Convert audio file to MP3 format using FFmpeg.
         
         Args:
             input_path: Path to input audio file
             output_path: Path for output MP3 file
+            move_input: Rename an MP3 input into place instead of copying it
         
         Returns:
             True if conversion successful, False otherwise
@@ -90,6 +93,12 @@ class AudioProcessor:
                 self.logger.info("Input is already MP3 at target location, no conversion needed")
                 return True
             
+            # If input is already MP3 and disposable, rename it into place
+            if input_path.lower().endswith('.mp3') and move_input:
+                shutil.move(input_path, output_path)
+                self.logger.info(f"Moved MP3 file from {input_path} to {output_path}")
+                return True
+            
             # If input is already MP3 but different location, copy it
             if input_path.lower().endswith('.mp3'):
                 shutil.copy2(input_path, output_path)
@@ -177,6 +177,19 @@ class LoggingService:
             min_level=logging.ERROR
         )
         
+        # Logger used for each operation type
+        self._logger_map = {
+            OperationType.RECORDING: self.recording_logger,
+            OperationType.PROCESSING: self.processing_logger,
+            OperationType.TRANSFER: self.transfer_logger,
+            OperationType.SCHEDULING: self.scheduler_logger,
+            OperationType.WEB_REQUEST: self.web_logger,
+            OperationType.SYSTEM: self.system_logger,
+            OperationType.DATABASE: self.app_logger,
+            OperationType.CONFIGURATION: self.app_logger,
+            OperationType.ERROR: self.error_logger
+        }
+        
     def _create_logger(self, 
                       name: str, 
                       filename: str, 
@@ -235,19 +248,7 @@ class LoggingService:
             exc_info: Include exception information
         """
         # Select appropriate logger based on operation type
-        logger_map = {
-            OperationType.RECORDING: self.recording_logger,
-            OperationType.PROCESSING: self.processing_logger,
-            OperationType.TRANSFER: self.transfer_logger,
-            OperationType.SCHEDULING: self.scheduler_logger,
-            OperationType.WEB_REQUEST: self.web_logger,
-            OperationType.SYSTEM: self.system_logger,
-            OperationType.DATABASE: self.app_logger,
-            OperationType.CONFIGURATION: self.app_logger,
-            OperationType.ERROR: self.error_logger
-        }
-        
-        logger = logger_map.get(operation_type, self.app_logger)
+        logger = self._logger_map.get(operation_type, self.app_logger)
         
         # Create log record with extra context
         extra = {
@@ -270,6 +271,22 @@ class LoggingService:
         if level in [LogLevel.ERROR, LogLevel.CRITICAL] and logger != self.error_logger:
             self.error_logger.log(level.value, message, extra=extra, exc_info=exc_info)
             
+    def is_enabled_for(self, level: LogLevel, operation_type: Optional[OperationType] = None) -> bool:
+        """
+        Check whether a message at the given level would be logged.
+        
+        Lets callers skip building context for messages that would be dropped.
+        
+        Args:
+            level: Log level to check
+            operation_type: Operation type whose logger to check (application logger if None)
+            
+        Returns:
+            True if the message would be logged, False otherwise
+        """
+        logger = self._logger_map.get(operation_type, self.app_logger)
+        return logger.isEnabledFor(level.value)
+    
     def log_recording_start(self, session_id: str, stream_id: int, stream_url: str):
         """Log the start of a recording session."""
         self.log_operation(
@@ -30,6 +30,38 @@ class WorkflowStage(Enum):
     CANCELLED = "cancelled"
 
 
+def _coalesced_progress(
+    callback: Callable[[float], None],
+    min_delta: float = 1.0,
+    min_interval: float = 0.2
+) -> Callable[[int, int], None]:
+    """
+    Wrap a percentage callback so per-chunk byte progress is forwarded sparingly.
+    
+    Args:
+        callback: Function receiving progress as a percentage
+        min_delta: Minimum percentage change before forwarding
+        min_interval: Minimum seconds between forwarded updates
+    
+    Returns:
+        Callback accepting (transferred, total) byte counts
+    """
+    last = [-min_delta, 0.0]  # last forwarded percentage, monotonic timestamp
+    
+    def progress(transferred: int, total: int) -> None:
+        if total <= 0:
+            return
+        pct = (transferred / total) * 100
+        now = time.monotonic()
+        if transferred < total and pct - last[0] < min_delta and now - last[1] < min_interval:
+            return
+        last[0] = pct
+        last[1] = now
+        callback(pct)
+    
+    return progress
+
+
 class RecordingSessionManager:
     """
     Manager for complete recording workflow orchestration.
@@ -59,7 +91,8 @@ class RecordingSessionManager:
         
         # Workflow state
         self.current_stage = WorkflowStage.INITIALIZING
-        self.start_time: Optional[datetime] = None
+        self._start_time: Optional[datetime] = None
+        self._start_time_iso: Optional[str] = None
         self.end_time: Optional[datetime] = None
         self.error_message: Optional[str] = None
         self.retry_count = 0
@@ -69,6 +102,9 @@ class RecordingSessionManager:
         self.raw_recording_path: Optional[str] = None
         self.processed_mp3_path: Optional[str] = None
         
+        # Size of the uploaded file; the local copy may be removed after transfer
+        self.transferred_bytes: Optional[int] = None
+        
         # Components
         self.stream_recorder: Optional[StreamRecorder] = None
         self.audio_processor = AudioProcessor()
@@ -76,18 +112,37 @@ class RecordingSessionManager:
         # Threading
         self.workflow_thread: Optional[threading.Thread] = None
         self.stop_event = threading.Event()
+        self._wake_event = threading.Event()  # Set on stop or recorder terminal state
         self._lock = threading.Lock()
         
         # Callbacks
         self.status_callback: Optional[Callable[[WorkflowStage, Dict[str, Any]], None]] = None
         self.progress_callback: Optional[Callable[[str, float], None]] = None
         
+        # Session info fields that never change after construction
+        self._static_info = {
+            'session_id': session_id,
+            'stream_name': stream_config.name,
+            'stream_url': stream_config.stream_url,
+            'duration_minutes': duration_minutes
+        }
+        
         # Logger
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         
         # Ensure output directory exists
         os.makedirs(self.output_directory, exist_ok=True)
     
+    @property
+    def start_time(self) -> Optional[datetime]:
+        """Workflow start time."""
+        return self._start_time
+    
+    @start_time.setter
+    def start_time(self, value: Optional[datetime]) -> None:
+        self._start_time = value
+        self._start_time_iso = value.isoformat() if value else None
+    
     def set_status_callback(self, callback: Callable[[WorkflowStage, Dict[str, Any]], None]) -> None:
         """Set callback function for status updates."""
         self.status_callback = callback
@@ -100,7 +155,7 @@ class RecordingSessionManager:
         """Update workflow stage and notify callback."""
         with self._lock:
             self.current_stage = stage
-            self.logger.info(f"Recording session {self.session_id} stage changed to: {stage.value}")
+            self.logger.info("Recording session %s stage changed to: %s", self.session_id, stage.value)
             
             if self.status_callback:
                 data = {
@@ -120,7 +175,7 @@ class RecordingSessionManager:
                 try:
                     self.status_callback(stage, data)
                 except Exception as e:
-                    self.logger.error(f"Error in status callback: {e}")
+                    self.logger.error("Error in status callback: %s", e)
     
     def _update_progress(self, operation: str, progress: float) -> None:
         """Update progress and notify callback."""
@@ -128,7 +183,7 @@ class RecordingSessionManager:
             try:
                 self.progress_callback(operation, progress)
             except Exception as e:
-                self.logger.error(f"Error in progress callback: {e}")
+                self.logger.error("Error in progress callback: %s", e)
     
     def start_recording(self) -> bool:
         """
@@ -201,14 +256,17 @@ class RecordingSessionManager:
                 self._update_status(WorkflowStage.CANCELLED)
                 return
             
-            # Stage 3: Transfer (placeholder - will be implemented in task 4)
-            if not self._execute_transfer_stage():
-                return
+            # Stage 3: Transfer; a failed upload doesn't fail the recording,
+            # the coordinator queues the file for retry instead
+            transferred = self._execute_transfer_stage()
             
             # Workflow completed successfully
             from ..utils.timezone_utils import get_local_now
             self.end_time = get_local_now()
-            self._update_status(WorkflowStage.COMPLETED)
+            self._update_status(WorkflowStage.COMPLETED, {
+                'transferred': transferred,
+                'file_size_bytes': self.transferred_bytes
+            })
             
             # Cleanup temporary files
             self._cleanup_temporary_files()
@@ -224,6 +282,8 @@ class RecordingSessionManager:
         self._update_progress("Recording audio stream", 0.0)
         
         try:
+            self._wake_event.clear()
+            
             # Create stream recorder
             self.stream_recorder = StreamRecorder(
                 stream_url=self.stream_config.stream_url,
@@ -233,7 +293,9 @@ class RecordingSessionManager:
             
             # Set up recorder status callback
             def recorder_status_callback(status: StreamRecordingStatus, data: Dict[str, Any]):
-                if status == StreamRecordingStatus.RECORDING:
+                if status not in (StreamRecordingStatus.CONNECTING, StreamRecordingStatus.RECORDING):
+                    self._wake_event.set()
+                elif status == StreamRecordingStatus.RECORDING:
                     # Update progress based on time elapsed
                     if self.duration_minutes and data.get('start_time'):
                         start_time_data = data['start_time']
@@ -263,12 +325,15 @@ class RecordingSessionManager:
                     self.stream_recorder.stop_recording()
                     break
                 
-                time.sleep(1)
+                # Block until stopped or the recorder finishes; the timeout only
+                # guards against a missed wake-up
+                self._wake_event.wait(timeout=30)
+                self._wake_event.clear()
             
             # Check recording result
             if self.stream_recorder.status == StreamRecordingStatus.COMPLETED:
                 self._update_progress("Recording audio stream", 100.0)
-                self.logger.info(f"Recording completed successfully: {self.raw_recording_path}")
+                self.logger.info("Recording completed successfully: %s", self.raw_recording_path)
                 return True
             else:
                 self.error_message = f"Recording failed: {self.stream_recorder.error_message}"
@@ -298,17 +363,20 @@ class RecordingSessionManager:
             # Process audio file
             self._update_progress("Processing audio file", 25.0)
             
+            # The raw recording is temporary, so an MP3 capture can be renamed
+            # into place rather than copied before tagging
             success = self.audio_processor.process_audio_file(
                 input_path=self.raw_recording_path,
                 output_path=self.processed_mp3_path,
                 metadata=metadata,
                 artwork_path=self.stream_config.artwork_path,
-                recording_date=self.start_time
+                recording_date=self.start_time,
+                move_input=True
             )
             
             if success:
                 self._update_progress("Processing audio file", 100.0)
-                self.logger.info(f"Audio processing completed: {self.processed_mp3_path}")
+                self.logger.info("Audio processing completed: %s", self.processed_mp3_path)
                 return True
             else:
                 self.error_message = "Audio processing failed"
@@ -322,23 +390,27 @@ class RecordingSessionManager:
             return False
     
     def _execute_transfer_stage(self) -> bool:
-        """Execute the file transfer stage using SCP."""
+        """
+        Execute the file transfer stage using SCP.
+        
+        Returns:
+            True if the file was uploaded, False if it still needs transferring
+        """
         self._update_status(WorkflowStage.TRANSFERRING)
         self._update_progress("Transferring file", 0.0)
         
         try:
-            self.logger.info(f"Transfer stage - file ready: {self.processed_mp3_path}")
-            self.logger.info(f"SCP destination: {self.stream_config.scp_destination}")
+            self.logger.info("Transfer stage - file ready: %s", self.processed_mp3_path)
+            self.logger.info("SCP destination: %s", self.stream_config.scp_destination)
             
-            # Import SCP transfer service
-            from .scp_transfer_service import SCPTransferService
-            scp_service = SCPTransferService()
+            # Shared SCP transfer service, so connections are reused between sessions
+            from .scp_transfer_service import get_scp_transfer_service
+            scp_service = get_scp_transfer_service()
             
-            # Progress callback for transfer updates
-            def progress_callback(transferred: int, total: int):
-                if total > 0:
-                    progress = (transferred / total) * 100
-                    self._update_progress("Transferring file", progress)
+            # Progress callback for transfer updates, coalesced from per-chunk events
+            progress_callback = _coalesced_progress(
+                lambda progress: self._update_progress("Transferring file", progress)
+            )
             
             # Perform SCP transfer
             result = scp_service.transfer_file(
@@ -348,7 +420,8 @@ class RecordingSessionManager:
             )
             
             if result and result.success:
-                self.logger.info(f"Transfer completed successfully to {self.stream_config.scp_destination}")
+                self.transferred_bytes = result.bytes_transferred
+                self.logger.info("Transfer completed successfully to %s", self.stream_config.scp_destination)
                 self._update_progress("Transferring file", 100.0)
                 return True
             else:
@@ -360,22 +433,16 @@ class RecordingSessionManager:
         except Exception as e:
             self.error_message = f"Transfer stage error: {str(e)}"
             self.logger.error(self.error_message, exc_info=True)
-            self._update_status(WorkflowStage.FAILED)
             return False
     
     def _cleanup_temporary_files(self) -> None:
         """Clean up temporary files after successful workflow."""
-        try:
-            # Remove raw recording file if it exists and is different from processed file
-            if (self.raw_recording_path and 
-                os.path.exists(self.raw_recording_path) and 
-                self.raw_recording_path != self.processed_mp3_path):
-                
-                os.remove(self.raw_recording_path)
-                self.logger.info(f"Cleaned up temporary file: {self.raw_recording_path}")
-                
-        except Exception as e:
-            self.logger.warning(f"Error cleaning up temporary files: {e}")
+        # Remove raw recording file if it is different from processed file
+        if self.raw_recording_path and self.raw_recording_path != self.processed_mp3_path:
+            try:
+                Path(self.raw_recording_path).unlink(missing_ok=True)
+            except OSError as e:
+                self.logger.warning("Error cleaning up temporary file %s: %s", self.raw_recording_path, e)
     
     def stop_recording(self) -> bool:
         """
@@ -387,8 +454,9 @@ class RecordingSessionManager:
         if self.current_stage in [WorkflowStage.COMPLETED, WorkflowStage.FAILED, WorkflowStage.CANCELLED]:
             return False
         
-        self.logger.info(f"Stopping recording session {self.session_id}")
+        self.logger.info("Stopping recording session %s", self.session_id)
         self.stop_event.set()
+        self._wake_event.set()
         
         # Stop stream recorder if active
         if self.stream_recorder:
@@ -419,7 +487,7 @@ class RecordingSessionManager:
             return False
         
         self.retry_count += 1
-        self.logger.info(f"Retrying recording session {self.session_id} (attempt {self.retry_count})")
+        self.logger.info("Retrying recording session %s (attempt %s)", self.session_id, self.retry_count)
         
         # Reset state
         self.current_stage = WorkflowStage.INITIALIZING
@@ -437,16 +505,13 @@ class RecordingSessionManager:
     
     def _cleanup_failed_attempt(self) -> None:
         """Clean up files from failed attempt."""
-        try:
-            files_to_clean = [self.raw_recording_path, self.processed_mp3_path]
-            
-            for file_path in files_to_clean:
-                if file_path and os.path.exists(file_path):
-                    os.remove(file_path)
-                    self.logger.info(f"Cleaned up failed attempt file: {file_path}")
-                    
-        except Exception as e:
-            self.logger.warning(f"Error cleaning up failed attempt: {e}")
+        for file_path in (self.raw_recording_path, self.processed_mp3_path):
+            if not file_path:
+                continue
+            try:
+                Path(file_path).unlink(missing_ok=True)
+            except OSError as e:
+                self.logger.warning("Error cleaning up failed attempt file %s: %s", file_path, e)
     
     def get_session_info(self) -> Dict[str, Any]:
         """
@@ -455,45 +520,54 @@ class RecordingSessionManager:
         Returns:
             Dictionary with session status and metadata
         """
-        with self._lock:
-            duration = None
-            if self.start_time:
-                end = self.end_time or datetime.now()
-                duration = (end - self.start_time).total_seconds()
-            
-            # Get file sizes
-            raw_file_size = 0
-            processed_file_size = 0
-            
-            if self.raw_recording_path and os.path.exists(self.raw_recording_path):
-                try:
-                    raw_file_size = os.path.getsize(self.raw_recording_path)
-                except OSError:
-                    pass
-            
-            if self.processed_mp3_path and os.path.exists(self.processed_mp3_path):
-                try:
-                    processed_file_size = os.path.getsize(self.processed_mp3_path)
-                except OSError:
-                    pass
-            
-            return {
-                'session_id': self.session_id,
-                'stage': self.current_stage.value,
-                'stream_name': self.stream_config.name,
-                'stream_url': self.stream_config.stream_url,
-                'duration_minutes': self.duration_minutes,
-                'start_time': self.start_time.isoformat() if self.start_time else None,
-                'end_time': self.end_time.isoformat() if self.end_time else None,
-                'duration_seconds': duration,
-                'retry_count': self.retry_count,
-                'max_retries': self.max_retries,
-                'error_message': self.error_message,
-                'raw_recording_path': self.raw_recording_path,
-                'processed_mp3_path': self.processed_mp3_path,
-                'raw_file_size_bytes': raw_file_size,
-                'processed_file_size_bytes': processed_file_size
-            }
+        # Snapshot attributes without taking the lock; each attribute read is
+        # atomic and _update_status only needs the lock to order callbacks
+        stage = self.current_stage
+        start = self._start_time
+        start_iso = self._start_time_iso
+        end = self.end_time
+        raw_path = self.raw_recording_path
+        processed_path = self.processed_mp3_path
+        
+        duration = None
+        if start:
+            if end is None:
+                from ..utils.timezone_utils import get_local_now
+                duration = (get_local_now() - start).total_seconds()
+            else:
+                duration = (end - start).total_seconds()
+        
+        # Get file sizes
+        raw_file_size = 0
+        processed_file_size = 0
+        
+        if raw_path:
+            try:
+                raw_file_size = os.path.getsize(raw_path)
+            except OSError:
+                pass
+        
+        if processed_path:
+            try:
+                processed_file_size = os.path.getsize(processed_path)
+            except OSError:
+                pass
+        
+        info = self._static_info.copy()
+        info.update({
+            'stage': stage.value,
+            'start_time': start_iso,
+            'end_time': end.isoformat() if end else None,
+            'duration_seconds': duration,
+            'retry_count': self.retry_count,
+            'max_retries': self.max_retries,
+            'error_message': self.error_message,
+            'raw_recording_path': raw_path,
+            'processed_mp3_path': processed_path,
+            'raw_file_size_bytes': raw_file_size,
+            'processed_file_size_bytes': processed_file_size
+        })
+        return info
     
     def cleanup(self) -> None:
         """Clean up resources and stop recording if active."""
@@ -3,7 +3,11 @@ SchedulerService using APScheduler for managing recording schedules.
 Handles cron expression parsing, job scheduling, and persistence across container restarts.
 """
 
+import functools
 import logging
+import queue
+import re
+import sys
 import threading
 import time
 from datetime import datetime, timedelta
@@ -11,9 +15,9 @@ from typing import Dict, List, Optional, Callable, Any
 from pathlib import Path
 
 from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MISSED
 from croniter import croniter
 
@@ -21,9 +25,93 @@ from ..models.recording_schedule import RecordingSchedule
 from ..models.recording_session import RecordingSession, RecordingStatus
 from ..models.stream_configuration import StreamConfiguration
 from ..models.repositories import ScheduleRepository, SessionRepository, ConfigurationRepository
+from ..models.database import get_db_manager
 from ..config import config
 
 
+RECORDING_JOB_PREFIX = "recording_schedule_"
+WINDOW_REFRESH_JOB_ID = "schedule_window_refresh"
+
+# Cheap pre-checks run before any cron parser sees user input
+_MAX_CRON_EXPRESSION_LENGTH = 256
+_CRON_CHAR_RE = re.compile(r'^[\d\s*,/?A-Z@-]+$', re.IGNORECASE)
+
+
+# Expressions that fire every N minutes, so the next run is plain arithmetic
+_FIXED_INTERVAL_CRON_MINUTES = {
+    "* * * * *": 1,
+    "*/5 * * * *": 5,
+    "*/10 * * * *": 10,
+    "*/15 * * * *": 15,
+    "*/20 * * * *": 20,
+    "*/30 * * * *": 30,
+    "0 * * * *": 60,
+}
+
+
+def _next_fixed_interval_run(cron_expression: str, base_time: datetime) -> Optional[datetime]:
+    """
+    Compute the next run for fixed-interval expressions without croniter.
+    
+    Returns:
+        Next run time, or None if the expression has no fast path
+    """
+    step = _FIXED_INTERVAL_CRON_MINUTES.get(cron_expression)
+    if step is None:
+        return None
+    
+    floored = base_time.replace(second=0, microsecond=0) - timedelta(minutes=base_time.minute % step)
+    next_run = floored + timedelta(minutes=step)
+    
+    # pytz-aware datetimes need normalizing after arithmetic across DST changes
+    normalize = getattr(next_run.tzinfo, 'normalize', None)
+    if normalize:
+        next_run = normalize(next_run)
+    
+    return next_run
+
+
+def _recording_job_id(schedule_id: int) -> str:
+    """Job ID for a schedule, interned so reloads share one string per schedule."""
+    return sys.intern(f"{RECORDING_JOB_PREFIX}{schedule_id}")
+
+
+@functools.lru_cache(maxsize=4096)
+def _cron_trigger_cached(cron_expression: str, timezone) -> CronTrigger:
+    """Build an APScheduler cron trigger, reusing triggers already built for the expression."""
+    return CronTrigger.from_crontab(cron_expression, timezone=timezone)
+
+
+@functools.lru_cache(maxsize=4096)
+def _trigger_description(trigger) -> str:
+    """Describe a trigger; triggers are immutable and shared through _cron_trigger_cached."""
+    return str(trigger)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cron_validation_error(cron_expression: str, timezone) -> Optional[str]:
+    """
+    Validate a stripped cron expression once per (expression, timezone).
+    
+    Returns:
+        None if valid, otherwise a description of the validation error
+    """
+    # Check basic format (5 fields)
+    if len(cron_expression.split()) != 5:
+        return "expected 5 fields"
+    
+    try:
+        # Test with croniter
+        croniter(cron_expression)
+        
+        # Test with APScheduler CronTrigger, caching the trigger for scheduling
+        _cron_trigger_cached(cron_expression, timezone)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    
+    return None
+
+
 class SchedulerService:
     """
     Service for managing recording schedules using APScheduler.
@@ -43,7 +131,6 @@ class SchedulerService:
         
         # Get database manager if not provided
         if db_manager is None:
-            from src.models.database import get_db_manager
             db_manager = get_db_manager()
         
         # Repositories
@@ -55,11 +142,26 @@ class SchedulerService:
         self.active_sessions: Dict[int, Any] = {}  # session_id -> RecordingSessionManager
         self._sessions_lock = threading.Lock()
         
+        # Concurrent recording slots; a slot is held from admission until the session
+        # finishes, and _slot_holders makes sure each session releases it only once
+        self._slot_sem = threading.BoundedSemaphore(config.MAX_CONCURRENT_RECORDINGS)
+        self._slot_holders: set = set()
+        self._admission_lock = threading.Lock()
+        
+        # Schedules registered with APScheduler; others are loaded once inside the lookahead window
+        self._registered_schedule_ids: set = set()
+        self.schedule_lookahead = timedelta(minutes=config.SCHEDULE_LOOKAHEAD_MINUTES)
+        
         # Callbacks
         self.recording_start_callback: Optional[Callable[[int, RecordingSchedule, StreamConfiguration], Any]] = None
         self.job_event_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None
         self.session_completion_callback: Optional[Callable[[int], None]] = None
         
+        # Job events are handed to a dedicated thread so a slow callback
+        # never holds up APScheduler's event dispatch
+        self._event_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._event_thread: Optional[threading.Thread] = None
+        
         # APScheduler configuration
         self.scheduler: Optional[BackgroundScheduler] = None
         self._setup_scheduler()
@@ -76,9 +178,11 @@ class SchedulerService:
                 'default': MemoryJobStore()
             }
             
-            # Configure thread pool executor with concurrent recording limits
+            # Recording jobs get one worker per concurrent recording; housekeeping
+            # runs on its own worker so it never occupies a recording slot
             executors = {
-                'default': ThreadPoolExecutor(max_workers=config.MAX_CONCURRENT_RECORDINGS)
+                'default': ThreadPoolExecutor(max_workers=config.MAX_CONCURRENT_RECORDINGS),
+                'maintenance': ThreadPoolExecutor(max_workers=1)
             }
             
             # Job defaults
@@ -119,10 +223,19 @@ class SchedulerService:
         try:
             if self.scheduler and not self.scheduler.running:
                 self.scheduler.start()
+                self._start_event_pump()
                 self.logger.info("SchedulerService started")
                 
-                # Load and schedule existing active schedules
+                # Load schedules due within the lookahead window and keep the window moving
                 self._load_existing_schedules()
+                self.scheduler.add_job(
+                    func=self._refresh_schedule_window,
+                    trigger=IntervalTrigger(seconds=max(60, self.schedule_lookahead.total_seconds() / 2)),
+                    id=WINDOW_REFRESH_JOB_ID,
+                    name="Refresh schedule window",
+                    executor='maintenance',
+                    replace_existing=True
+                )
                 
                 return True
             else:
@@ -145,8 +258,12 @@ class SchedulerService:
                 # Stop all active recording sessions
                 self._stop_all_active_sessions()
                 
-                # Shutdown scheduler
+                # Jobs live only in memory, so make sure they still mirror the schedules
+                self._check_job_consistency()
+                
+                # Shutdown scheduler, then let queued job events drain
                 self.scheduler.shutdown(wait=True)
+                self._stop_event_pump()
                 self.logger.info("SchedulerService stopped")
                 return True
             else:
@@ -157,6 +274,29 @@ class SchedulerService:
             self.logger.error(f"Failed to stop scheduler: {e}")
             return False
     
+    def _check_job_consistency(self) -> bool:
+        """
+        Compare the scheduler's recording jobs with the registered schedule IDs.
+        
+        Returns:
+            True if both sets match, False otherwise
+        """
+        live_ids = {
+            job.id[len(RECORDING_JOB_PREFIX):]
+            for job in self.scheduler.get_jobs()
+            if job.id.startswith(RECORDING_JOB_PREFIX)
+        }
+        registered_ids = {str(schedule_id) for schedule_id in self._registered_schedule_ids.copy()}
+        
+        if live_ids != registered_ids:
+            self.logger.warning(
+                "Scheduled jobs out of sync with schedules: missing jobs %s, unexpected jobs %s",
+                sorted(registered_ids - live_ids), sorted(live_ids - registered_ids)
+            )
+            return False
+        
+        return True
+    
     def is_running(self) -> bool:
         """
         Check if the scheduler service is running.
@@ -167,18 +307,44 @@ class SchedulerService:
         return self.scheduler is not None and self.scheduler.running
     
     def _load_existing_schedules(self) -> None:
-        """Load and schedule existing active schedules from database."""
+        """Load and schedule active schedules due within the lookahead window."""
         try:
-            active_schedules = self.schedule_repo.get_active_schedules()
+            due_schedules = self.schedule_repo.get_due_within(self.schedule_lookahead)
             
-            for schedule in active_schedules:
+            for schedule in due_schedules:
                 self._schedule_recording_job(schedule)
             
-            self.logger.info(f"Loaded {len(active_schedules)} existing schedules")
+            self.logger.info(f"Loaded {len(due_schedules)} existing schedules")
             
         except Exception as e:
             self.logger.error(f"Failed to load existing schedules: {e}")
     
+    def _refresh_schedule_window(self) -> None:
+        """Register newly due schedules and drop jobs for schedules no longer active."""
+        try:
+            # Snapshot before querying so schedules added meanwhile are not dropped
+            registered = self._registered_schedule_ids.copy()
+            
+            active_ids = set(self.schedule_repo.get_active_schedule_ids())
+            for schedule_id in registered - active_ids:
+                self._remove_recording_job(schedule_id)
+            
+            added = 0
+            for schedule in self.schedule_repo.get_due_within(self.schedule_lookahead):
+                if schedule.id not in registered and self._schedule_recording_job(schedule):
+                    added += 1
+            
+            if added:
+                self.logger.info(f"Registered {added} schedules entering the lookahead window")
+            
+        except Exception as e:
+            self.logger.error(f"Failed to refresh schedule window: {e}")
+    
+    def refresh_schedules(self) -> None:
+        """Reconcile scheduled jobs with the active schedules in the database."""
+        if self.scheduler and self.scheduler.running:
+            self._refresh_schedule_window()
+    
     def validate_cron_expression(self, cron_expression: str) -> bool:
         """
         Validate cron expression format and syntax.
@@ -193,28 +359,27 @@ class SchedulerService:
             if not cron_expression or not cron_expression.strip():
                 return False
             
-            cron_expression = cron_expression.strip()
-            
-            # Check basic format (5 fields)
-            parts = cron_expression.split()
-            if len(parts) != 5:
+            # Reject oversized or garbage input before it reaches the parsers or the cache
+            if len(cron_expression) > _MAX_CRON_EXPRESSION_LENGTH:
+                self.logger.error(f"Cron expression too long ({len(cron_expression)} characters)")
+                return False
+            if not _CRON_CHAR_RE.match(cron_expression):
+                self.logger.error(f"Invalid characters in cron expression '{cron_expression}'")
                 return False
             
-            # Test with croniter
-            croniter(cron_expression)
+            cron_expression = cron_expression.strip()
             
-            # Test with APScheduler CronTrigger using local timezone
+            # Validate against croniter and APScheduler using local timezone
             from ..utils.timezone_utils import get_local_timezone
-            local_tz = get_local_timezone()
-            CronTrigger.from_crontab(cron_expression, timezone=local_tz)
+            error = _cron_validation_error(cron_expression, get_local_timezone())
+            if error:
+                self.logger.error(f"Invalid cron expression '{cron_expression}': {error}")
+                return False
             
             return True
             
         except Exception as e:
             self.logger.error(f"Invalid cron expression '{cron_expression}': {e}")
-            self.logger.error(f"Exception type: {type(e).__name__}")
-            import traceback
-            self.logger.error(f"Full traceback: {traceback.format_exc()}")
             return False
     
     def calculate_next_run_time(self, cron_expression: str, base_time: Optional[datetime] = None) -> Optional[datetime]:
@@ -236,8 +401,10 @@ class SchedulerService:
                 from ..utils.timezone_utils import get_local_now
                 base_time = get_local_now()
             
-            cron = croniter(cron_expression, base_time)
-            next_run = cron.get_next(datetime)
+            next_run = _next_fixed_interval_run(cron_expression.strip(), base_time)
+            if next_run is None:
+                cron = croniter(cron_expression, base_time)
+                next_run = cron.get_next(datetime)
             
             # Ensure the returned datetime is timezone-aware
             if next_run.tzinfo is None:
@@ -266,7 +433,7 @@ class SchedulerService:
                 return False
             
             # Update next run time
-            schedule.update_next_run_time()
+            self._update_next_run_time(schedule)
             
             # Schedule the job if active
             if schedule.is_active:
@@ -300,7 +467,7 @@ class SchedulerService:
             self._remove_recording_job(schedule.id)
             
             # Update next run time
-            schedule.update_next_run_time()
+            self._update_next_run_time(schedule)
             
             # Schedule new job if active
             if schedule.is_active:
@@ -315,6 +482,17 @@ class SchedulerService:
             self.logger.error(f"Failed to update schedule: {e}")
             return False
     
+    def _update_next_run_time(self, schedule: RecordingSchedule) -> None:
+        """
+        Set a schedule's next run time from the cached cron trigger.
+        
+        Args:
+            schedule: RecordingSchedule whose cron expression was already validated
+        """
+        from ..utils.timezone_utils import get_local_timezone, get_local_now
+        trigger = _cron_trigger_cached(schedule.cron_expression.strip(), get_local_timezone())
+        schedule.next_run_time = trigger.get_next_fire_time(None, get_local_now())
+    
     def remove_schedule(self, schedule_id: int) -> bool:
         """
         Remove a recording schedule.
@@ -351,17 +529,20 @@ class SchedulerService:
                 self.logger.error("Scheduler not running")
                 return False
             
-            job_id = f"recording_schedule_{schedule.id}"
+            job_id = _recording_job_id(schedule.id)
             
             # Create cron trigger with local timezone
             from ..utils.timezone_utils import get_local_timezone
             local_tz = get_local_timezone()
-            trigger = CronTrigger.from_crontab(schedule.cron_expression, timezone=local_tz)
+            trigger = _cron_trigger_cached(schedule.cron_expression.strip(), local_tz)
             
-            # Get stream config name for job naming
+            # Get stream config name for job naming, reusing the eagerly loaded
+            # configuration when the schedule came from a window query
             stream_name = "Unknown"
             try:
-                stream_config = self.config_repo.get_by_id(schedule.stream_config_id)
+                stream_config = schedule.__dict__.get('stream_config')
+                if stream_config is None:
+                    stream_config = self.config_repo.get_by_id(schedule.stream_config_id)
                 if stream_config:
                     stream_name = stream_config.name
             except Exception:
@@ -374,8 +555,10 @@ class SchedulerService:
                 args=[schedule.id],
                 id=job_id,
                 name=f"Recording: {stream_name}",
+                executor='default',
                 replace_existing=True
             )
+            self._registered_schedule_ids.add(schedule.id)
             
             self.logger.info(f"Scheduled job {job_id} with cron: {schedule.cron_expression}")
             return True
@@ -398,7 +581,8 @@ class SchedulerService:
             if not self.scheduler:
                 return True
             
-            job_id = f"recording_schedule_{schedule_id}"
+            job_id = _recording_job_id(schedule_id)
+            self._registered_schedule_ids.discard(schedule_id)
             
             try:
                 self.scheduler.remove_job(job_id)
@@ -423,8 +607,8 @@ class SchedulerService:
         try:
             self.logger.info(f"Executing recording job for schedule {schedule_id}")
             
-            # Get schedule and stream configuration
-            schedule = self.schedule_repo.get_by_id(schedule_id)
+            # Get schedule and stream configuration in one query
+            schedule = self.schedule_repo.get_with_config(schedule_id)
             if not schedule:
                 self.logger.error(f"Schedule {schedule_id} not found")
                 return
@@ -433,85 +617,117 @@ class SchedulerService:
                 self.logger.info(f"Schedule {schedule_id} is not active, skipping")
                 return
             
-            stream_config = self.config_repo.get_by_id(schedule.stream_config_id)
+            stream_config = schedule.stream_config
             if not stream_config:
                 self.logger.error(f"Stream configuration {schedule.stream_config_id} not found")
                 return
             
-            # Check concurrent recording limits
-            if not self._can_start_recording():
+            # Reserve a concurrent recording slot
+            if not self._try_acquire_slot():
                 self.logger.warning(f"Maximum concurrent recordings reached, skipping schedule {schedule_id}")
                 return
             
-            # Create recording session using Pydantic model
-            from src.models.recording_session import RecordingSessionCreate
-            session_data = RecordingSessionCreate(
-                schedule_id=schedule_id,
-                start_time=datetime.now(),
-                status=RecordingStatus.SCHEDULED
-            )
-            
-            # Save session to database
-            session = self.session_repo.create(session_data)
+            # Create the recording session and update the schedule's run times together
+            try:
+                # Local configured time, as _update_next_run_time uses, so the
+                # saved next run doesn't shift when the system TZ differs
+                from ..utils.timezone_utils import get_local_now
+                start_time = get_local_now()
+                schedule.update_next_run_time(base=start_time)
+                session_id = self.schedule_repo.record_run(
+                    schedule_id,
+                    start_time,
+                    next_run_time=schedule.next_run_time
+                )
+            except Exception:
+                self._slot_sem.release()
+                raise
             
-            # Update schedule's last run time and next run time
-            from src.models.recording_schedule import RecordingScheduleUpdate
-            schedule_update = RecordingScheduleUpdate(
-                last_run_time=datetime.now()
-            )
-            # Update next run time will be handled by the repository
-            self.schedule_repo.update(schedule.id, schedule_update)
+            with self._admission_lock:
+                self._slot_holders.add(session_id)
             
             # Start recording using callback
             if self.recording_start_callback:
                 try:
-                    recording_manager = self.recording_start_callback(session.id, schedule, stream_config)
+                    recording_manager = self.recording_start_callback(session_id, schedule, stream_config)
                     
-                    # Track active session
-                    with self._sessions_lock:
-                        self.active_sessions[session.id] = recording_manager
+                    # Track active session, unless it already finished and gave its slot back
+                    with self._admission_lock:
+                        if session_id in self._slot_holders:
+                            with self._sessions_lock:
+                                self.active_sessions[session_id] = recording_manager
                     
-                    self.logger.info(f"Started recording session {session.id} for schedule {schedule_id}")
+                    self.logger.info(f"Started recording session {session_id} for schedule {schedule_id}")
                     
                 except Exception as e:
                     self.logger.error(f"Failed to start recording via callback: {e}")
                     # Update session status to failed
-                    self.session_repo.update_status(session.id, RecordingStatus.FAILED, str(e))
+                    self.release_recording_slot(session_id)
+                    self.session_repo.update_status(session_id, RecordingStatus.FAILED, str(e))
             else:
                 self.logger.error("No recording start callback configured")
-                self.session_repo.update_status(session.id, RecordingStatus.FAILED, "No recording start callback configured")
+                self.release_recording_slot(session_id)
+                self.session_repo.update_status(session_id, RecordingStatus.FAILED, "No recording start callback configured")
             
         except Exception as e:
             self.logger.error(f"Error executing recording job for schedule {schedule_id}: {e}")
     
-    def _can_start_recording(self) -> bool:
+    def _try_acquire_slot(self) -> bool:
         """
-        Check if a new recording can be started based on concurrent limits.
+        Reserve a concurrent recording slot without blocking.
         
         Returns:
-            True if recording can be started, False otherwise
+            True if a slot was reserved, False otherwise
+        """
+        # Hard cap on tracked sessions so managers that are never removed
+        # cannot accumulate without bound
+        tracked_limit = 2 * config.MAX_CONCURRENT_RECORDINGS
+        if len(self.active_sessions) >= tracked_limit:
+            self.logger.warning(
+                "Tracking %d sessions (limit %d), rejecting new recording",
+                len(self.active_sessions), tracked_limit
+            )
+            return False
+        
+        return self._slot_sem.acquire(blocking=False)
+    
+    def release_recording_slot(self, session_id: int) -> None:
         """
-        with self._sessions_lock:
-            active_count = len([
-                session for session in self.active_sessions.values()
-                if session and hasattr(session, 'current_stage') and 
-                session.current_stage.value in ['recording', 'processing', 'transferring']
-            ])
-            
-            return active_count < config.MAX_CONCURRENT_RECORDINGS
+        Give back the concurrent recording slot held by a session.
+        
+        Safe to call more than once and for sessions that never held a slot.
+        
+        Args:
+            session_id: Session that finished, failed or was cancelled
+        """
+        with self._admission_lock:
+            if session_id not in self._slot_holders:
+                return
+            self._slot_holders.discard(session_id)
+        
+        self._slot_sem.release()
     
     def _stop_all_active_sessions(self) -> None:
         """Stop all active recording sessions."""
+        # Detach the sessions under the lock, then stop them without holding it
         with self._sessions_lock:
-            for session_id, session_manager in list(self.active_sessions.items()):
-                try:
-                    if session_manager and hasattr(session_manager, 'stop_recording'):
-                        session_manager.stop_recording()
-                        self.logger.info(f"Stopped active recording session {session_id}")
-                except Exception as e:
-                    self.logger.error(f"Error stopping session {session_id}: {e}")
-            
+            sessions = list(self.active_sessions.items())
             self.active_sessions.clear()
+        
+        for session_id, session_manager in sessions:
+            try:
+                if session_manager and hasattr(session_manager, 'stop_recording'):
+                    session_manager.stop_recording()
+                    self.logger.info(f"Stopped active recording session {session_id}")
+            except Exception as e:
+                self.logger.error(f"Error stopping session {session_id}: {e}")
+        
+        with self._admission_lock:
+            held_slots = len(self._slot_holders)
+            self._slot_holders.clear()
+        
+        for _ in range(held_slots):
+            self._slot_sem.release()
     
     def remove_completed_session(self, session_id: int) -> None:
         """
@@ -520,6 +736,8 @@ class SchedulerService:
         Args:
             session_id: Session ID to remove
         """
+        self.release_recording_slot(session_id)
+        
         with self._sessions_lock:
             if session_id in self.active_sessions:
                 del self.active_sessions[session_id]
@@ -532,8 +750,8 @@ class SchedulerService:
         Returns:
             Dictionary of session_id -> RecordingSessionManager
         """
-        with self._sessions_lock:
-            return dict(self.active_sessions)
+        # dict.copy() is atomic under the GIL; only writers take _sessions_lock
+        return self.active_sessions.copy()
     
     def get_scheduled_jobs(self) -> List[Dict[str, Any]]:
         """
@@ -545,16 +763,23 @@ class SchedulerService:
         if not self.scheduler:
             return []
         
-        jobs = []
-        for job in self.scheduler.get_jobs():
-            jobs.append({
+        return [
+            {
                 'id': job.id,
                 'name': job.name,
                 'next_run_time': job.next_run_time.isoformat() if job.next_run_time else None,
-                'trigger': str(job.trigger)
-            })
+                'trigger': _trigger_description(job.trigger)
+            }
+            for job in self.scheduler.get_jobs()
+            if job.id.startswith(RECORDING_JOB_PREFIX)
+        ]
+    
+    def _count_scheduled_jobs(self) -> int:
+        """Count recording jobs without building their descriptions."""
+        if not self.scheduler:
+            return 0
         
-        return jobs
+        return sum(1 for job in self.scheduler.get_jobs() if job.id.startswith(RECORDING_JOB_PREFIX))
     
     def set_recording_start_callback(self, callback: Callable[[int, RecordingSchedule, StreamConfiguration], Any]) -> None:
         """
@@ -586,17 +811,52 @@ class SchedulerService:
         self.session_completion_callback = callback
         self.logger.info("Session completion callback configured")
     
+    def _start_event_pump(self) -> None:
+        """Start the thread that delivers job events to the callback."""
+        if self._event_thread and self._event_thread.is_alive():
+            return
+        
+        self._event_thread = threading.Thread(
+            target=self._event_pump,
+            name="scheduler-job-events",
+            daemon=True
+        )
+        self._event_thread.start()
+    
+    def _stop_event_pump(self, timeout: float = 5.0) -> None:
+        """Deliver queued job events, then stop the event thread."""
+        if not self._event_thread:
+            return
+        
+        self._event_queue.put_nowait(None)
+        self._event_thread.join(timeout=timeout)
+        self._event_thread = None
+    
+    def _event_pump(self) -> None:
+        """Deliver queued job events until a None sentinel arrives."""
+        while True:
+            item = self._event_queue.get()
+            if item is None:
+                break
+            
+            event_type, event_data = item
+            try:
+                if self.job_event_callback:
+                    self.job_event_callback(event_type, event_data)
+            except Exception as e:
+                self.logger.error(f"Error in job event callback for {event_type}: {e}")
+    
     def _job_executed_listener(self, event) -> None:
         """Handle job executed events."""
         try:
             self.logger.info(f"Job executed: {event.job_id}")
             
             if self.job_event_callback:
-                self.job_event_callback('job_executed', {
+                self._event_queue.put_nowait(('job_executed', {
                     'job_id': event.job_id,
                     'scheduled_run_time': event.scheduled_run_time.isoformat() if event.scheduled_run_time else None,
                     'retval': str(event.retval) if event.retval else None
-                })
+                }))
                 
         except Exception as e:
             self.logger.error(f"Error in job executed listener: {e}")
@@ -607,12 +867,12 @@ class SchedulerService:
             self.logger.error(f"Job error: {event.job_id} - {event.exception}")
             
             if self.job_event_callback:
-                self.job_event_callback('job_error', {
+                self._event_queue.put_nowait(('job_error', {
                     'job_id': event.job_id,
                     'scheduled_run_time': event.scheduled_run_time.isoformat() if event.scheduled_run_time else None,
                     'exception': str(event.exception),
                     'traceback': event.traceback
-                })
+                }))
                 
         except Exception as e:
             self.logger.error(f"Error in job error listener: {e}")
@@ -623,10 +883,10 @@ class SchedulerService:
             self.logger.warning(f"Job missed: {event.job_id}")
             
             if self.job_event_callback:
-                self.job_event_callback('job_missed', {
+                self._event_queue.put_nowait(('job_missed', {
                     'job_id': event.job_id,
                     'scheduled_run_time': event.scheduled_run_time.isoformat() if event.scheduled_run_time else None
-                })
+                }))
                 
         except Exception as e:
             self.logger.error(f"Error in job missed listener: {e}")
@@ -642,6 +902,6 @@ class SchedulerService:
             'running': self.scheduler.running if self.scheduler else False,
             'active_sessions_count': len(self.active_sessions),
             'max_concurrent_recordings': config.MAX_CONCURRENT_RECORDINGS,
-            'scheduled_jobs_count': len(self.scheduler.get_jobs()) if self.scheduler else 0,
+            'scheduled_jobs_count': self._count_scheduled_jobs(),
             'database_url': self.database_url
         }
\ No newline at end of file
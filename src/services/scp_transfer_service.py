@@ -3,14 +3,24 @@ SCPTransferService for secure file transfers using SSH/SCP.
 Handles SSH key-based authentication, retry logic, and transfer monitoring.
 """
 
+import functools
+import itertools
 import os
+import random
+import re
+import shlex
+import socket
+import stat
 import time
 import logging
+import mmap
 import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 
 import paramiko
@@ -20,6 +30,79 @@ from paramiko.ssh_exception import SSHException, AuthenticationException, NoVali
 from ..config import config
 
 
+# Idle time after which a pooled SSH connection is closed instead of reused
+CLIENT_IDLE_TTL_SECONDS = 300
+
+# Number of finished transfers kept for status lookups
+MAX_FINISHED_TRANSFERS = 256
+
+# Retry backoff cap, plus up to this fraction of random jitter so transfers
+# that failed together don't reconnect together
+MAX_RETRY_BACKOFF_SECONDS = 300
+RETRY_JITTER_FRACTION = 0.1
+
+# Transport tuning for bulk uploads: large socket buffers and SSH channel
+# windows; packets stay at the 32 KiB most servers accept
+SOCKET_BUFFER_BYTES = 32 * 1024 * 1024
+CHANNEL_WINDOW_SIZE = 2 ** 31 - 1
+CHANNEL_MAX_PACKET_SIZE = 32768
+
+# Upload block size; blocks are handed to SFTP as memoryview slices
+UPLOAD_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Payload per SFTP write request; OpenSSH's sftp-server drops the session on
+# messages over 256 KiB, so this is the max-write-length it advertises.
+# paramiko defaults to 32 KiB, which some servers require, so hosts that fail
+# with the larger size fall back to it
+SFTP_MAX_REQUEST_SIZE = 255 * 1024
+SFTP_FALLBACK_REQUEST_SIZE = 32 * 1024
+
+# Uncompressed audio worth zlib-compressing on the wire; everything else,
+# notably MP3/AAC/OGG/Opus recordings, is sent without transport compression
+COMPRESSIBLE_EXTENSIONS = frozenset({'.wav', '.wave', '.pcm', '.raw', '.aiff', '.aif'})
+
+
+# username@hostname:/remote/path or username@hostname:port:/remote/path
+_SCP_DESTINATION_RE = re.compile(r'(?P<user>[^@]+)@(?P<host>[^:]+)(?::(?P<port>\d+))?:(?P<path>.*)')
+
+
+@functools.lru_cache(maxsize=128)
+def _split_scp_destination(scp_destination: str) -> Tuple[str, str, int, str]:
+    """
+    Split an SCP destination into (username, hostname, port, remote path).
+    
+    Raises:
+        ValueError: If destination format is invalid
+    """
+    match = _SCP_DESTINATION_RE.fullmatch(scp_destination)
+    if match is None:
+        raise ValueError(f"Invalid SCP destination format: {scp_destination}")
+    
+    port = int(match.group('port')) if match.group('port') else 22
+    return match.group('user'), match.group('host'), port, match.group('path')
+
+
+def _full_remote_path(local_path: str, remote_path: str) -> str:
+    """Resolve a remote directory path ending in '/' to a path for the local file's name."""
+    if remote_path.endswith('/'):
+        return remote_path + os.path.basename(local_path)
+    return remote_path
+
+
+def local_file_size(local_path: str) -> Optional[int]:
+    """Size of a regular local file from a single stat, or None if there is no such file."""
+    try:
+        st = os.stat(local_path)
+    except OSError:
+        return None
+    return st.st_size if stat.S_ISREG(st.st_mode) else None
+
+
+def should_compress(local_path: str) -> bool:
+    """Whether a file benefits from SSH transport compression."""
+    return os.path.splitext(local_path)[1].lower() in COMPRESSIBLE_EXTENSIONS
+
+
 class TransferStatus(Enum):
     """Transfer status enumeration."""
     PENDING = "pending"
@@ -29,7 +112,7 @@ class TransferStatus(Enum):
     RETRYING = "retrying"
 
 
-@dataclass
+@dataclass(frozen=True)
 class TransferResult:
     """Result of a file transfer operation."""
     success: bool
@@ -38,6 +121,7 @@ class TransferResult:
     bytes_transferred: int = 0
     transfer_time_seconds: float = 0.0
     retry_count: int = 0
+    started_at: Optional[datetime] = None
 
 
 @dataclass
@@ -62,8 +146,43 @@ class SCPTransferService:
     def __init__(self):
         """Initialize SCPTransferService."""
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-        self._active_transfers: Dict[str, TransferResult] = {}
+        self._active_transfers: Dict[int, TransferResult] = {}
+        self._finished_transfers: "OrderedDict[int, TransferResult]" = OrderedDict()
+        self._transfer_ids = itertools.count(1)
         self._transfer_lock = threading.Lock()
+        
+        # Set on shutdown to wake transfers waiting between retries
+        self._shutdown = threading.Event()
+        
+        # Background transfers run on a lazily created pool; uploads to any one
+        # host are capped so parallel transfers don't swamp a single server
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        
+        # Idle authenticated SSH clients reused across transfers and retries,
+        # keyed by destination and credentials: key -> [(client, released at)].
+        # A transfer checks a client out for its own use and hands it back
+        # afterwards, so only idle clients are ever closed by the pool
+        self._client_cache: Dict[tuple, List[Tuple[SSHClient, float]]] = {}
+        self._client_lock = threading.Lock()
+        
+        # Default key file, resolved on first use; config.SSH_CONFIG_DIR doesn't change
+        self._default_private_key_path: Optional[str] = None
+        
+        # Parsed private keys by (path, mtime, size), so keys are decoded once
+        self._pkey_cache: Dict[tuple, paramiko.PKey] = {}
+        
+        # Remote directories known to exist, as (hostname, port, username, path);
+        # guarded by _transfer_lock
+        self._known_remote_dirs: set = set()
+        
+        # Servers that refused an exec channel (SFTP-only accounts), as
+        # (hostname, port, username); guarded by _transfer_lock
+        self._exec_unavailable: set = set()
+        
+        # Servers that failed with large SFTP write requests, as
+        # (hostname, port, username); guarded by _transfer_lock
+        self._small_request_servers: set = set()
     
     def parse_scp_destination(self, scp_destination: str) -> tuple[SCPConfig, str]:
         """
@@ -80,25 +199,7 @@ class SCPTransferService:
         Raises:
             ValueError: If destination format is invalid
         """
-        if '@' not in scp_destination or ':' not in scp_destination:
-            raise ValueError(f"Invalid SCP destination format: {scp_destination}")
-        
-        # Split username@hostname:path
-        user_host, path_part = scp_destination.rsplit(':', 1)
-        username, hostname_port = user_host.split('@', 1)
-        
-        # Check if port is specified
-        if ':' in hostname_port:
-            hostname, port_str = hostname_port.rsplit(':', 1)
-            try:
-                port = int(port_str)
-            except ValueError:
-                # Port is not a number, treat as part of hostname
-                hostname = hostname_port
-                port = 22
-        else:
-            hostname = hostname_port
-            port = 22
+        username, hostname, port, path_part = _split_scp_destination(scp_destination)
         
         # Create config with defaults from application config
         scp_config = SCPConfig(
@@ -115,26 +216,28 @@ class SCPTransferService:
     
     def _get_default_private_key_path(self) -> Optional[str]:
         """Get default SSH private key path."""
-        # Use the specific id_ed25519 key from config directory
-        key_path = os.path.join(config.SSH_CONFIG_DIR, 'id_ed25519')
-        if os.path.exists(key_path):
-            return key_path
+        # Reuse the key found earlier; a missing key is looked up again next
+        # time in case one has been added since
+        if self._default_private_key_path is not None:
+            return self._default_private_key_path
         
-        # Fallback to other keys in config directory
-        key_files = ['ssh_key', 'id_rsa', 'id_ecdsa']
+        # Prefer id_ed25519, then fall back to other keys in config directory
+        key_files = ['id_ed25519', 'ssh_key', 'id_rsa', 'id_ecdsa']
         for key_file in key_files:
             key_path = os.path.join(config.SSH_CONFIG_DIR, key_file)
             if os.path.exists(key_path):
+                self._default_private_key_path = key_path
                 return key_path
         
         return None
     
-    def _create_ssh_client(self, scp_config: SCPConfig) -> SSHClient:
+    def _create_ssh_client(self, scp_config: SCPConfig, compress: bool = False) -> SSHClient:
         """
         Create and configure SSH client.
         
         Args:
             scp_config: SCP configuration
+            compress: Negotiate zlib transport compression
             
         Returns:
             Configured SSH client
@@ -143,7 +246,7 @@ class SCPTransferService:
             AuthenticationException: If authentication fails
             SSHException: If connection fails
         """
-        client = SSHClient()
+        client = paramiko.SSHClient()
         client.set_missing_host_key_policy(AutoAddPolicy())
         
         # Prepare authentication parameters
@@ -157,28 +260,7 @@ class SCPTransferService:
         # Use private key if available, otherwise password
         if scp_config.private_key_path and os.path.exists(scp_config.private_key_path):
             try:
-                # Try to load key with different key types
-                private_key = None
-                key_types = [
-                    paramiko.Ed25519Key,
-                    paramiko.RSAKey,
-                    paramiko.ECDSAKey,
-                    paramiko.DSSKey
-                ]
-                
-                for key_type in key_types:
-                    try:
-                        private_key = key_type.from_private_key_file(scp_config.private_key_path)
-                        self.logger.debug(f"Successfully loaded {key_type.__name__} from: {scp_config.private_key_path}")
-                        break
-                    except Exception:
-                        continue
-                
-                if private_key:
-                    auth_kwargs['pkey'] = private_key
-                else:
-                    raise Exception("Unable to load private key with any supported key type")
-                    
+                auth_kwargs['pkey'] = self._load_private_key(scp_config.private_key_path)
             except Exception as e:
                 self.logger.warning(f"Failed to load private key {scp_config.private_key_path}: {e}")
                 if scp_config.password:
@@ -188,15 +270,376 @@ class SCPTransferService:
         else:
             raise AuthenticationException("No valid authentication method available")
         
-        client.connect(**auth_kwargs)
+        sock = self._open_socket(scp_config)
+        try:
+            client.connect(sock=sock, compress=compress, **auth_kwargs)
+        except Exception:
+            sock.close()
+            raise
+        
+        # Channels opened from now on, including SFTP, use the enlarged window
+        transport = client.get_transport()
+        if transport is not None:
+            transport.default_window_size = CHANNEL_WINDOW_SIZE
+            transport.default_max_packet_size = CHANNEL_MAX_PACKET_SIZE
+        
         return client
     
+    def _load_private_key(self, key_path: str) -> paramiko.PKey:
+        """
+        Load a private key, reusing the parsed key while the file is unchanged.
+        
+        Args:
+            key_path: Path to the private key file
+            
+        Returns:
+            Parsed private key
+            
+        Raises:
+            SSHException: If the key can't be loaded with any supported key type
+        """
+        key_stat = os.stat(key_path)
+        cache_key = (key_path, key_stat.st_mtime_ns, key_stat.st_size)
+        
+        with self._client_lock:
+            private_key = self._pkey_cache.get(cache_key)
+        if private_key is not None:
+            return private_key
+        
+        # Try the key type named in the PEM header first; OpenSSH-format
+        # files don't name it, so those keep the default order
+        with open(key_path, 'r', errors='replace') as key_file:
+            header = key_file.readline()
+        
+        key_types = [
+            paramiko.Ed25519Key,
+            paramiko.RSAKey,
+            paramiko.ECDSAKey,
+            paramiko.DSSKey
+        ]
+        if 'BEGIN RSA' in header:
+            key_types.insert(0, key_types.pop(1))
+        elif 'BEGIN EC' in header:
+            key_types.insert(0, key_types.pop(2))
+        elif 'BEGIN DSA' in header:
+            key_types.insert(0, key_types.pop(3))
+        
+        for key_type in key_types:
+            try:
+                private_key = key_type.from_private_key_file(key_path)
+                self.logger.debug(f"Successfully loaded {key_type.__name__} from: {key_path}")
+                break
+            except Exception:
+                continue
+        else:
+            raise SSHException("Unable to load private key with any supported key type")
+        
+        with self._client_lock:
+            # Keep only the current version of each key file
+            for stale_key in [k for k in self._pkey_cache if k[0] == key_path]:
+                del self._pkey_cache[stale_key]
+            self._pkey_cache[cache_key] = private_key
+        
+        return private_key
+    
+    def _open_socket(self, scp_config: SCPConfig) -> socket.socket:
+        """
+        Open a TCP connection tuned for bulk uploads.
+        
+        Args:
+            scp_config: SCP configuration
+            
+        Returns:
+            Connected socket with Nagle disabled and enlarged buffers
+        """
+        sock = socket.create_connection((scp_config.hostname, scp_config.port), timeout=scp_config.timeout)
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_BYTES)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_BYTES)
+        except OSError as e:
+            # The kernel may cap or refuse the tuning; the connection still works
+            self.logger.debug(f"Could not tune socket options: {e}")
+        return sock
+    
+    @staticmethod
+    def _client_key(scp_config: SCPConfig, compress: bool = False) -> tuple:
+        """Pool key for the SSH connection described by a configuration."""
+        return (scp_config.hostname, scp_config.port, scp_config.username, scp_config.private_key_path, compress)
+    
+    @staticmethod
+    def _client_is_usable(client: SSHClient) -> bool:
+        """Check whether a pooled client still has a live transport."""
+        transport = client.get_transport()
+        return transport is not None and transport.is_active()
+    
+    def _get_ssh_client(self, scp_config: SCPConfig, compress: bool = False) -> SSHClient:
+        """
+        Check out an authenticated SSH client, reusing an idle pooled connection when possible.
+        
+        The caller has the client to itself until it passes it to
+        _release_ssh_client or _discard_ssh_client.
+        
+        Args:
+            scp_config: SCP configuration
+            compress: Whether the connection should use transport compression
+            
+        Returns:
+            Connected SSH client
+            
+        Raises:
+            AuthenticationException: If authentication fails
+            SSHException: If connection fails
+        """
+        key = self._client_key(scp_config, compress)
+        now = time.monotonic()
+        stale = []
+        client = None
+        
+        with self._client_lock:
+            # Drop idle connections for any destination while we are here
+            for cached_key, entries in list(self._client_cache.items()):
+                fresh = []
+                for cached_client, released_at in entries:
+                    if now - released_at > CLIENT_IDLE_TTL_SECONDS:
+                        stale.append(cached_client)
+                    else:
+                        fresh.append((cached_client, released_at))
+                if fresh:
+                    self._client_cache[cached_key] = fresh
+                else:
+                    del self._client_cache[cached_key]
+            
+            # Take the most recently released client that is still connected
+            idle = self._client_cache.get(key, [])
+            while idle and client is None:
+                cached_client, _ = idle.pop()
+                if self._client_is_usable(cached_client):
+                    client = cached_client
+                else:
+                    stale.append(cached_client)
+            if not idle:
+                self._client_cache.pop(key, None)
+        
+        for stale_client in stale:
+            self._close_client(stale_client)
+        
+        if client is not None:
+            return client
+        
+        # Connect outside the lock so a slow handshake doesn't block other destinations
+        return self._create_ssh_client(scp_config, compress=compress)
+    
+    def _release_ssh_client(self, scp_config: SCPConfig, client: SSHClient, compress: bool = False) -> None:
+        """
+        Return a checked-out client to the pool, or close it if it can't be reused.
+        
+        Args:
+            scp_config: SCP configuration the client was obtained for
+            client: Client to return
+            compress: Whether the client uses transport compression
+        """
+        if self._client_is_usable(client):
+            key = self._client_key(scp_config, compress)
+            with self._client_lock:
+                # Clients finishing after shutdown are closed, not pooled
+                if not self._shutdown.is_set():
+                    self._client_cache.setdefault(key, []).append((client, time.monotonic()))
+                    return
+        
+        self._close_client(client)
+    
+    def _discard_ssh_client(self, client: SSHClient) -> None:
+        """
+        Close a checked-out client instead of returning it, e.g. after a transport error.
+        
+        Args:
+            client: Client to discard
+        """
+        self._close_client(client)
+    
+    def _close_client(self, client: SSHClient) -> None:
+        """Close an SSH client, ignoring errors from already-dead connections."""
+        try:
+            client.close()
+        except Exception as e:
+            self.logger.debug(f"Error closing SSH client: {e}")
+    
+    def close_all(self) -> None:
+        """Close all idle pooled SSH connections; checked-out clients are closed when released after shutdown."""
+        with self._client_lock:
+            clients = [client for entries in self._client_cache.values() for client, _ in entries]
+            self._client_cache.clear()
+        
+        for client in clients:
+            self._close_client(client)
+    
+    @staticmethod
+    def _remote_dir_key(scp_config: SCPConfig, remote_dir: str) -> tuple:
+        """Key for a remote directory in the known-directories set."""
+        return (scp_config.hostname, scp_config.port, scp_config.username, remote_dir)
+    
+    def _remember_remote_dir(self, scp_config: SCPConfig, remote_dir: str) -> None:
+        """Record a remote directory and its ancestors as existing."""
+        with self._transfer_lock:
+            current_dir = remote_dir
+            while current_dir and current_dir != '/':
+                self._known_remote_dirs.add(self._remote_dir_key(scp_config, current_dir))
+                current_dir = os.path.dirname(current_dir)
+    
+    def _forget_remote_dir(self, scp_config: SCPConfig, remote_dir: str) -> None:
+        """Stop assuming a remote directory exists."""
+        with self._transfer_lock:
+            self._known_remote_dirs.discard(self._remote_dir_key(scp_config, remote_dir))
+    
+    def _mkdir_via_exec(self, client: SSHClient, scp_config: SCPConfig, remote_dir: str) -> bool:
+        """
+        Create a remote directory with a single `mkdir -p` command.
+        
+        Args:
+            client: Connected SSH client
+            scp_config: SCP configuration of the destination
+            remote_dir: Remote directory path
+            
+        Returns:
+            True if the directory was created or already existed
+        """
+        server_key = (scp_config.hostname, scp_config.port, scp_config.username)
+        with self._transfer_lock:
+            if server_key in self._exec_unavailable:
+                return False
+        
+        try:
+            stdin, stdout, stderr = client.exec_command(
+                f"mkdir -p {shlex.quote(remote_dir)}", timeout=scp_config.timeout
+            )
+            # Close stdin so a forced SFTP subsystem exits instead of waiting
+            stdout.channel.shutdown_write()
+            exit_status = stdout.channel.recv_exit_status()
+        except SSHException as e:
+            self.logger.debug(f"Exec not available on {scp_config.hostname}, using SFTP mkdir: {e}")
+            with self._transfer_lock:
+                self._exec_unavailable.add(server_key)
+            return False
+        except Exception as e:
+            self.logger.debug(f"Remote mkdir -p failed on {scp_config.hostname}: {e}")
+            return False
+        
+        return exit_status == 0
+    
+    def _ensure_remote_dir(self, client: SSHClient, sftp: paramiko.SFTPClient,
+                           scp_config: SCPConfig, remote_dir: str) -> None:
+        """
+        Create a remote directory and its missing parents.
+        
+        Directories already known to exist are skipped without any round-trip.
+        Otherwise a single `mkdir -p` is run over an exec channel, falling back
+        to walking the path over SFTP on servers that only allow SFTP.
+        Failures are logged and ignored, since the upload may still succeed.
+        
+        Args:
+            client: Connected SSH client
+            sftp: Open SFTP client
+            scp_config: SCP configuration of the destination
+            remote_dir: Remote directory path
+        """
+        if not remote_dir or remote_dir == '/':
+            return
+        
+        with self._transfer_lock:
+            if self._remote_dir_key(scp_config, remote_dir) in self._known_remote_dirs:
+                return
+        
+        if self._mkdir_via_exec(client, scp_config, remote_dir):
+            return
+        
+        try:
+            # Try to create directory structure recursively
+            dirs_to_create = []
+            current_dir = remote_dir
+            while current_dir and current_dir != '/':
+                try:
+                    sftp.stat(current_dir)
+                    break  # Directory exists
+                except FileNotFoundError:
+                    dirs_to_create.append(current_dir)
+                    current_dir = os.path.dirname(current_dir)
+            
+            # Create directories from parent to child
+            for dir_path in reversed(dirs_to_create):
+                try:
+                    sftp.mkdir(dir_path)
+                except Exception:
+                    # Directory might already exist or permission denied
+                    pass
+        except Exception as e:
+            self.logger.debug(f"Could not ensure remote directory exists: {e}")
+            # Continue anyway, the upload might still work
+    
+    def _upload_file(
+        self,
+        sftp: paramiko.SFTPClient,
+        local_path: str,
+        remote_path: str,
+        file_size: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        max_request_size: Optional[int] = None
+    ) -> int:
+        """
+        Upload a local file over SFTP in large blocks.
+        
+        The file is memory-mapped and written as memoryview slices of the map,
+        so blocks go straight from the page cache to paramiko without first
+        being read into a Python buffer.
+        
+        Args:
+            sftp: Open SFTP client
+            local_path: Local file path
+            remote_path: Full remote file path
+            file_size: Local file size in bytes
+            progress_callback: Optional callback taking (bytes transferred, total bytes)
+            max_request_size: Payload per SFTP write request, paramiko's default if None
+            
+        Returns:
+            Number of bytes uploaded
+            
+        Raises:
+            IOError: If the remote file size does not match after upload
+        """
+        transferred = 0
+        
+        with open(local_path, 'rb', buffering=0) as local_file:
+            with sftp.open(remote_path, 'wb', bufsize=0) as remote_file:
+                # Don't wait for each write to be acknowledged, as put() does
+                remote_file.set_pipelined(True)
+                if max_request_size:
+                    remote_file.MAX_REQUEST_SIZE = max_request_size
+                
+                # Map the size the file has now; empty files can't be mapped
+                mapped_size = os.fstat(local_file.fileno()).st_size
+                if mapped_size:
+                    with mmap.mmap(local_file.fileno(), mapped_size, access=mmap.ACCESS_READ) as mapped, \
+                            memoryview(mapped) as view:
+                        while transferred < mapped_size:
+                            with view[transferred:transferred + UPLOAD_BLOCK_SIZE] as block:
+                                remote_file.write(block)
+                                transferred += len(block)
+                            if progress_callback:
+                                progress_callback(transferred, file_size)
+        
+        remote_size = sftp.stat(remote_path).st_size
+        if remote_size != transferred:
+            raise IOError(f"Size mismatch after upload: {remote_size} != {transferred}")
+        
+        return transferred
+    
     def _transfer_file_with_progress(
         self,
         local_path: str,
         remote_path: str,
         scp_config: SCPConfig,
-        progress_callback: Optional[Callable[[int, int], None]] = None
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        file_size: Optional[int] = None
     ) -> TransferResult:
         """
         Transfer file with progress monitoring.
@@ -206,67 +649,63 @@ class SCPTransferService:
             remote_path: Remote file path
             scp_config: SCP configuration
             progress_callback: Optional progress callback function
+            file_size: Local file size if already known
             
         Returns:
             TransferResult with operation details
         """
         start_time = time.time()
-        file_size = os.path.getsize(local_path)
+        if file_size is None:
+            file_size = os.path.getsize(local_path)
         bytes_transferred = 0  # Initialize to avoid UnboundLocalError in exception handlers
+        server_key = (scp_config.hostname, scp_config.port, scp_config.username)
+        with self._transfer_lock:
+            if server_key in self._small_request_servers:
+                request_size = SFTP_FALLBACK_REQUEST_SIZE
+            else:
+                request_size = SFTP_MAX_REQUEST_SIZE
+        
+        # If remote path ends with '/', append the local filename
+        full_remote_path = _full_remote_path(local_path, remote_path)
+        remote_dir = os.path.dirname(full_remote_path)
+        
+        compress = should_compress(local_path)
         
         try:
-            client = self._create_ssh_client(scp_config)
+            client = self._get_ssh_client(scp_config, compress=compress)
+            reusable = True
+            sftp_channel_lost = False
             
             try:
                 # Create SCP client
                 scp = client.open_sftp()
                 
-                # Ensure remote directory exists
-                remote_dir = os.path.dirname(remote_path)
-                if remote_dir and remote_dir != '/':
-                    try:
-                        # Try to create directory structure recursively
-                        dirs_to_create = []
-                        current_dir = remote_dir
-                        while current_dir and current_dir != '/':
-                            try:
-                                scp.stat(current_dir)
-                                break  # Directory exists
-                            except FileNotFoundError:
-                                dirs_to_create.append(current_dir)
-                                current_dir = os.path.dirname(current_dir)
-                        
-                        # Create directories from parent to child
-                        for dir_path in reversed(dirs_to_create):
-                            try:
-                                scp.mkdir(dir_path)
-                            except Exception:
-                                # Directory might already exist or permission denied
-                                pass
-                    except Exception as e:
-                        self.logger.debug(f"Could not ensure remote directory exists: {e}")
-                        # Continue anyway, the put operation might still work
-                
-                # Transfer file with progress monitoring
-                bytes_transferred = 0
-                
-                def progress_wrapper(transferred, total):
-                    nonlocal bytes_transferred
-                    bytes_transferred = transferred
-                    if progress_callback:
-                        progress_callback(transferred, total)
-                
-                # If remote path ends with '/', append the local filename
-                if remote_path.endswith('/'):
-                    local_filename = os.path.basename(local_path)
-                    full_remote_path = remote_path + local_filename
-                else:
-                    full_remote_path = remote_path
+                try:
+                    # Ensure remote directory exists
+                    self._ensure_remote_dir(client, scp, scp_config, remote_dir)
+                    
+                    # Transfer file with progress monitoring
+                    bytes_transferred = 0
+                    
+                    def progress_wrapper(transferred, total):
+                        nonlocal bytes_transferred
+                        bytes_transferred = transferred
+                        if progress_callback:
+                            progress_callback(transferred, total)
+                    
+                    self.logger.debug(f"Starting SFTP transfer: {local_path} -> {full_remote_path}")
+                    self._upload_file(scp, local_path, full_remote_path, file_size, progress_wrapper, request_size)
+                    self.logger.debug(f"SFTP transfer completed successfully")
+                except Exception:
+                    # Servers end the SFTP session on requests they won't accept;
+                    # paramiko may report that as EOFError or OSError, not SSHException
+                    sftp_channel_lost = scp.get_channel().closed
+                    raise
+                finally:
+                    scp.close()
                 
-                self.logger.debug(f"Starting SFTP transfer: {local_path} -> {full_remote_path}")
-                scp.put(local_path, full_remote_path, callback=progress_wrapper)
-                self.logger.debug(f"SFTP transfer completed successfully")
-                scp.close()
+                # The upload proves the directory exists; skip the checks next time
+                self._remember_remote_dir(scp_config, remote_dir)
                 
                 transfer_time = time.time() - start_time
                 
@@ -282,8 +721,26 @@ class SCPTransferService:
                     transfer_time_seconds=transfer_time
                 )
                 
+            except Exception as e:
+                # The directory may be gone; the next attempt checks again. Only
+                # transport failures cost the connection, not e.g. a remote
+                # permission error or size mismatch
+                reusable = not isinstance(e, (SSHException, EOFError))
+                self._forget_remote_dir(scp_config, remote_dir)
+                if ((isinstance(e, (SSHException, EOFError)) or sftp_channel_lost)
+                        and request_size > SFTP_FALLBACK_REQUEST_SIZE):
+                    self.logger.warning(
+                        f"SFTP error on {scp_config.hostname}, using {SFTP_FALLBACK_REQUEST_SIZE} byte requests from now on"
+                    )
+                    with self._transfer_lock:
+                        self._small_request_servers.add(server_key)
+                raise
+            
             finally:
-                client.close()
+                if reusable:
+                    self._release_ssh_client(scp_config, client, compress)
+                else:
+                    self._discard_ssh_client(client)
                 
         except (AuthenticationException, NoValidConnectionsError) as e:
             error_msg = f"Authentication/Connection failed: {str(e)}"
@@ -309,12 +766,13 @@ class SCPTransferService:
             
         except Exception as e:
             error_msg = f"Unexpected error during transfer: {str(e)}"
-            self.logger.error(f"{error_msg} (Type: {type(e).__name__})")
-            self.logger.error(f"Local path: {local_path}")
-            self.logger.error(f"Remote path: {remote_path}")
-            self.logger.error(f"File size: {file_size} bytes")
-            import traceback
-            self.logger.error(f"Full traceback: {traceback.format_exc()}")
+            # One record per failure; the traceback is only formatted at DEBUG,
+            # so a down server doesn't cost a stack walk on every retry
+            self.logger.error(
+                "%s (Type: %s) local=%s remote=%s size=%s bytes",
+                error_msg, type(e).__name__, local_path, remote_path, file_size,
+                exc_info=self.logger.isEnabledFor(logging.DEBUG)
+            )
             return TransferResult(
                 success=False,
                 status=TransferStatus.FAILED,
@@ -328,7 +786,8 @@ class SCPTransferService:
         local_path: str,
         scp_destination: str,
         progress_callback: Optional[Callable[[int, int], None]] = None,
-        custom_config: Optional[SCPConfig] = None
+        custom_config: Optional[SCPConfig] = None,
+        file_size: Optional[int] = None
     ) -> TransferResult:
         """
         Transfer a file to remote destination with retry logic.
@@ -338,11 +797,15 @@ class SCPTransferService:
             scp_destination: SCP destination string (user@host:/path)
             progress_callback: Optional progress callback function
             custom_config: Optional custom SCP configuration
+            file_size: Local file size if the caller has just checked it
             
         Returns:
             TransferResult with operation details
         """
-        if not os.path.exists(local_path):
+        # One stat serves as the existence check and the size for every attempt
+        if file_size is None:
+            file_size = local_file_size(local_path)
+        if file_size is None:
             return TransferResult(
                 success=False,
                 status=TransferStatus.FAILED,
@@ -365,13 +828,19 @@ class SCPTransferService:
                 )
         
         # Track transfer
-        transfer_id = f"{local_path}_{datetime.now().isoformat()}"
+        transfer_id = next(self._transfer_ids)
+        started_at = datetime.now()
         
-        with self._transfer_lock:
-            self._active_transfers[transfer_id] = TransferResult(
-                success=False,
-                status=TransferStatus.PENDING
-            )
+        # Active entries are immutable and replaced wholesale, so status updates
+        # are single dict stores and need no lock
+        self._active_transfers[transfer_id] = TransferResult(
+            success=False,
+            status=TransferStatus.PENDING,
+            started_at=started_at
+        )
+        
+        # Resolve the destination once rather than on every attempt
+        remote_path = _full_remote_path(local_path, remote_path)
         
         # Attempt transfer with retry logic
         last_result = None
@@ -380,43 +849,147 @@ class SCPTransferService:
             if attempt > 0:
                 self.logger.info(f"Retrying transfer attempt {attempt + 1}/{scp_config.max_retries + 1}")
                 
-                with self._transfer_lock:
-                    self._active_transfers[transfer_id].status = TransferStatus.RETRYING
-                    self._active_transfers[transfer_id].retry_count = attempt
+                self._active_transfers[transfer_id] = TransferResult(
+                    success=False,
+                    status=TransferStatus.RETRYING,
+                    retry_count=attempt,
+                    started_at=started_at
+                )
                 
-                time.sleep(scp_config.retry_delay * (2 ** (attempt - 1)))  # Exponential backoff
+                # Exponential backoff, interrupted by shutdown
+                if self._shutdown.wait(self._retry_delay(scp_config, attempt)):
+                    self.logger.info(f"Shutting down, abandoning transfer of {local_path}")
+                    break
             
             # Update status to in progress
-            with self._transfer_lock:
-                self._active_transfers[transfer_id].status = TransferStatus.IN_PROGRESS
+            self._active_transfers[transfer_id] = TransferResult(
+                success=False,
+                status=TransferStatus.IN_PROGRESS,
+                retry_count=attempt,
+                started_at=started_at
+            )
             
             # Attempt transfer
-            result = self._transfer_file_with_progress(
-                local_path, remote_path, scp_config, progress_callback
-            )
-            result.retry_count = attempt
+            with self._host_semaphore(scp_config.hostname):
+                result = self._transfer_file_with_progress(
+                    local_path, remote_path, scp_config, progress_callback, file_size
+                )
+            result = replace(result, retry_count=attempt, started_at=started_at)
             last_result = result
             
             if result.success:
-                # Cleanup local file if configured
+                # Cleanup local file if configured; unlinking a large recording
+                # can take a while, so it doesn't hold up the caller
                 if scp_config.cleanup_after_transfer:
-                    try:
-                        os.remove(local_path)
-                        self.logger.info(f"Cleaned up local file: {local_path}")
-                    except Exception as e:
-                        self.logger.warning(f"Failed to cleanup local file {local_path}: {e}")
+                    self._cleanup_local_file_async(local_path)
                 
                 break
             else:
                 self.logger.warning(f"Transfer attempt {attempt + 1} failed: {result.error_message}")
         
-        # Update final status
+        # Move to the bounded history of finished transfers
         with self._transfer_lock:
-            self._active_transfers[transfer_id] = last_result
+            self._finished_transfers[transfer_id] = last_result
+            self._active_transfers.pop(transfer_id, None)
+            while len(self._finished_transfers) > MAX_FINISHED_TRANSFERS:
+                self._finished_transfers.popitem(last=False)
         
         return last_result
     
-    def get_transfer_status(self, transfer_id: str) -> Optional[TransferResult]:
+    def _host_semaphore(self, hostname: str) -> threading.BoundedSemaphore:
+        """Get the semaphore limiting concurrent uploads to a host."""
+        with self._transfer_lock:
+            semaphore = self._host_semaphores.get(hostname)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(config.MAX_TRANSFERS_PER_HOST)
+                self._host_semaphores[hostname] = semaphore
+            return semaphore
+    
+    def transfer_file_async(
+        self,
+        local_path: str,
+        scp_destination: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        custom_config: Optional[SCPConfig] = None
+    ) -> "Future[TransferResult]":
+        """
+        Transfer a file in the background, with the same retry logic as transfer_file.
+        
+        Args:
+            local_path: Path to local file
+            scp_destination: SCP destination string (user@host:/path)
+            progress_callback: Optional progress callback function
+            custom_config: Optional custom SCP configuration
+            
+        Returns:
+            Future resolving to the TransferResult
+        """
+        return self._get_executor().submit(
+            self.transfer_file, local_path, scp_destination, progress_callback, custom_config
+        )
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the background transfer pool, creating it on first use."""
+        with self._transfer_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=config.MAX_CONCURRENT_TRANSFERS,
+                    thread_name_prefix="scp-transfer"
+                )
+            return self._executor
+    
+    def _cleanup_local_file(self, local_path: str) -> None:
+        """Remove a transferred local file, logging rather than raising on failure."""
+        try:
+            os.remove(local_path)
+            self.logger.info(f"Cleaned up local file: {local_path}")
+        except Exception as e:
+            self.logger.warning(f"Failed to cleanup local file {local_path}: {e}")
+    
+    def _cleanup_local_file_async(self, local_path: str) -> None:
+        """Remove a transferred local file on the background pool."""
+        if not self._shutdown.is_set():
+            try:
+                self._get_executor().submit(self._cleanup_local_file, local_path)
+                return
+            except RuntimeError:
+                # Pool shut down in the meantime
+                pass
+        self._cleanup_local_file(local_path)
+    
+    @staticmethod
+    def _retry_delay(scp_config: SCPConfig, attempt: int) -> float:
+        """
+        Backoff before a retry: exponential, capped, with random jitter.
+        
+        Args:
+            scp_config: SCP configuration with the base retry delay
+            attempt: Retry attempt number, starting at 1
+            
+        Returns:
+            Delay in seconds
+        """
+        delay = min(scp_config.retry_delay * (2 ** (attempt - 1)), MAX_RETRY_BACKOFF_SECONDS)
+        return delay + random.uniform(0, delay * RETRY_JITTER_FRACTION)
+    
+    @property
+    def is_shut_down(self) -> bool:
+        """Whether shutdown() has been called."""
+        return self._shutdown.is_set()
+    
+    def shutdown(self) -> None:
+        """Wake transfers waiting to retry so they give up, and close pooled connections."""
+        self._shutdown.set()
+        
+        with self._transfer_lock:
+            executor = self._executor
+            self._executor = None
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        self.close_all()
+    
+    def get_transfer_status(self, transfer_id: int) -> Optional[TransferResult]:
         """
         Get status of a transfer operation.
         
@@ -426,18 +999,30 @@ class SCPTransferService:
         Returns:
             TransferResult if found, None otherwise
         """
-        with self._transfer_lock:
-            return self._active_transfers.get(transfer_id)
+        result = self._active_transfers.get(transfer_id)
+        if result is None:
+            with self._transfer_lock:
+                result = self._finished_transfers.get(transfer_id)
+        return result
     
-    def get_active_transfers(self) -> Dict[str, TransferResult]:
+    def get_active_transfers(self) -> Dict[int, TransferResult]:
         """
-        Get all active transfers.
+        Get transfers that are pending, in progress or retrying.
+        
+        Returns:
+            Dictionary of transfer_id -> TransferResult
+        """
+        return self._active_transfers.copy()
+    
+    def get_finished_transfers(self) -> Dict[int, TransferResult]:
+        """
+        Get the most recent finished transfers, oldest first.
         
         Returns:
             Dictionary of transfer_id -> TransferResult
         """
         with self._transfer_lock:
-            return self._active_transfers.copy()
+            return dict(self._finished_transfers)
     
     def test_connection(self, scp_destination: str, custom_config: Optional[SCPConfig] = None) -> bool:
         """
@@ -456,12 +1041,26 @@ class SCPTransferService:
             else:
                 scp_config, _ = self.parse_scp_destination(scp_destination)
             
-            client = self._create_ssh_client(scp_config)
-            client.close()
+            # Keep the authenticated client pooled for the transfer that usually follows
+            client = self._get_ssh_client(scp_config)
+            self._release_ssh_client(scp_config, client)
             
             self.logger.info(f"Connection test successful to {scp_config.username}@{scp_config.hostname}")
             return True
             
         except Exception as e:
             self.logger.error(f"Connection test failed: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+
+
+_shared_service: Optional[SCPTransferService] = None
+_shared_service_lock = threading.Lock()
+
+
+def get_scp_transfer_service() -> SCPTransferService:
+    """Get the shared SCPTransferService, so pooled connections are reused across sessions."""
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None:
+            _shared_service = SCPTransferService()
+        return _shared_service
@@ -3,21 +3,160 @@ StreamRecorder class for audio stream capture using FFmpeg.
 Supports multiple streaming protocols and provides validation and connection testing.
 """
 
+import functools
+import selectors
+import shutil
 import subprocess
 import threading
 import time
 import logging
 import os
 import signal
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, Callable
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from enum import Enum
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse
+from urllib3.util.retry import Retry
 
 from ..config import config
 
 
+# Lines of FFmpeg stderr kept for error reporting
+STDERR_TAIL_LINES = 200
+
+# Longest the recording monitor sleeps without an event; it is normally woken
+# by a stop request, FFmpeg closing stderr, or the duration deadline
+MONITOR_MAX_WAIT_SECONDS = 30
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_executable(name: str) -> str:
+    """
+    Resolve an executable to an absolute path once, so spawns skip the PATH walk.
+    
+    Args:
+        name: Executable name or path
+        
+    Returns:
+        Absolute path if found on PATH, otherwise the name unchanged
+    """
+    return shutil.which(name) or name
+
+
+def warm_up_ffmpeg() -> None:
+    """Run `ffmpeg -version` once so the binary is paged in before the first recording."""
+    try:
+        subprocess.run(
+            [resolve_executable(config.FFMPEG_PATH), '-version'],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=15
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logging.getLogger(__name__).warning(f"FFmpeg warm-up failed: {e}")
+
+
+# Recording threads are pooled; the scheduler already caps concurrent
+# recordings at MAX_CONCURRENT_RECORDINGS
+_recording_executor: Optional[ThreadPoolExecutor] = None
+_recording_executor_lock = threading.Lock()
+
+
+def _get_recording_executor() -> ThreadPoolExecutor:
+    """Get the thread pool that runs recordings, creating it on first use."""
+    global _recording_executor
+    with _recording_executor_lock:
+        if _recording_executor is None:
+            _recording_executor = ThreadPoolExecutor(
+                max_workers=config.MAX_CONCURRENT_RECORDINGS,
+                thread_name_prefix="recording"
+            )
+        return _recording_executor
+
+
+# Status callbacks run on one shared thread, so observers doing database or
+# network work never stall a recorder and each sees transitions in order
+_status_callback_executor: Optional[ThreadPoolExecutor] = None
+_status_callback_executor_lock = threading.Lock()
+
+
+def _get_status_callback_executor() -> ThreadPoolExecutor:
+    """Get the single-thread executor that delivers status callbacks."""
+    global _status_callback_executor
+    with _status_callback_executor_lock:
+        if _status_callback_executor is None:
+            _status_callback_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="recording-status"
+            )
+        return _status_callback_executor
+
+
+# Connect and read timeouts for stream checks; dead hosts fail on connect
+HTTP_CHECK_TIMEOUT = (3, 7)
+
+# Most stream checks run at once when testing a batch of URLs
+STREAM_CHECK_MAX_WORKERS = 16
+
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session() -> requests.Session:
+    """Get the pooled HTTP session shared by all stream checks."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=32,
+                max_retries=Retry(total=2, backoff_factor=0.2)
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers['User-Agent'] = 'AudioStreamRecorder/1.0'
+            _http_session = session
+        return _http_session
+
+
+# How long a successful stream check is trusted, so a "Test" in the UI
+# followed by starting the recording probes the stream only once
+VALIDATION_CACHE_TTL_SECONDS = 30
+
+# Stream URL -> monotonic time of its last successful check
+_validation_cache: Dict[str, float] = {}
+_validation_cache_lock = threading.Lock()
+
+
+def _recently_validated(stream_url: str) -> bool:
+    """Whether the stream passed a check within the cache TTL."""
+    with _validation_cache_lock:
+        checked_at = _validation_cache.get(stream_url)
+        if checked_at is None:
+            return False
+        if time.monotonic() - checked_at >= VALIDATION_CACHE_TTL_SECONDS:
+            del _validation_cache[stream_url]
+            return False
+        return True
+
+
+def _remember_validation(stream_url: str) -> None:
+    """Record a successful stream check."""
+    with _validation_cache_lock:
+        _validation_cache[stream_url] = time.monotonic()
+
+
+def _forget_validation(stream_url: str) -> None:
+    """Drop a cached check, e.g. after recording from the stream failed."""
+    with _validation_cache_lock:
+        _validation_cache.pop(stream_url, None)
+
+
 class RecordingStatus(Enum):
     """Recording status enumeration."""
     IDLE = "idle"
@@ -34,6 +173,19 @@ class StreamRecorder:
     Handles stream validation, connection testing, and duration limits.
     """
     
+    # Connectivity check for each supported URL scheme, by method name so
+    # the checks stay patchable per instance
+    _SCHEME_CHECKS = {
+        'http': '_test_http_stream',
+        'https': '_test_http_stream',
+        'rtmp': '_test_rtmp_stream',  # For RTMP streams, we'll rely on FFmpeg to validate
+        'rtmps': '_test_rtmp_stream',
+    }
+    
+    # Output directories already created, shared by all recorders
+    _ensured_dirs: set = set()
+    _ensured_dirs_lock = threading.Lock()
+    
     def __init__(self, stream_url: str, output_path: str, duration_minutes: Optional[int] = None):
         """
         Initialize StreamRecorder.
@@ -50,19 +202,49 @@ class StreamRecorder:
         self.start_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
         self.process: Optional[subprocess.Popen] = None
-        self.recording_thread: Optional[threading.Thread] = None
+        self.recording_future: Optional[Future] = None
         self.stop_event = threading.Event()
         self.error_message: Optional[str] = None
         self.bytes_recorded: int = 0
         
+        # FFmpeg stderr is drained continuously so a full pipe never stalls it
+        self._stderr_tail: deque = deque(maxlen=STDERR_TAIL_LINES)
+        self._stderr_thread: Optional[threading.Thread] = None
+        self._stderr_eof = threading.Event()
+        
+        # Self-pipe that wakes the monitor on stop requests and FFmpeg exit
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        self._wake_lock = threading.Lock()
+        
         # Callbacks for status updates
         self.status_callback: Optional[Callable[[RecordingStatus, Dict[str, Any]], None]] = None
         
         # Logger
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         
-        # Ensure output directory exists
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        # Ensure output directory exists; recorders mostly share a few folders
+        output_dir = os.path.dirname(output_path)
+        if output_dir not in self._ensured_dirs:
+            with self._ensured_dirs_lock:
+                os.makedirs(output_dir, exist_ok=True)
+                self._ensured_dirs.add(output_dir)
+    
+    @property
+    def stream_url(self) -> str:
+        """URL of the audio stream to record."""
+        return self._stream_url
+    
+    @stream_url.setter
+    def stream_url(self, value: str) -> None:
+        self._stream_url = value
+        self._url_scheme: Optional[str] = None
+    
+    def _get_url_scheme(self) -> str:
+        """Scheme of the stream URL, parsed once per URL."""
+        if self._url_scheme is None:
+            self._url_scheme = urlparse(self._stream_url).scheme
+        return self._url_scheme
     
     def set_status_callback(self, callback: Callable[[RecordingStatus, Dict[str, Any]], None]) -> None:
         """Set callback function for status updates."""
@@ -71,9 +253,10 @@ class StreamRecorder:
     def _update_status(self, status: RecordingStatus, extra_data: Optional[Dict[str, Any]] = None) -> None:
         """Update recording status and notify callback."""
         self.status = status
-        self.logger.info(f"Recording status changed to: {status.value}")
+        self.logger.info("Recording status changed to: %s", status.value)
         
         if self.status_callback:
+            # Snapshot the state now; the callback runs later on another thread
             data = {
                 'status': status.value,
                 'stream_url': self.stream_url,
@@ -87,9 +270,18 @@ class StreamRecorder:
                 data.update(extra_data)
             
             try:
-                self.status_callback(status, data)
-            except Exception as e:
-                self.logger.error(f"Error in status callback: {e}")
+                _get_status_callback_executor().submit(self._run_status_callback, self.status_callback, status, data)
+            except RuntimeError as e:
+                # Executor already shut down at interpreter exit
+                self.logger.error(f"Could not dispatch status callback: {e}")
+    
+    def _run_status_callback(self, callback: Callable[[RecordingStatus, Dict[str, Any]], None],
+                             status: RecordingStatus, data: Dict[str, Any]) -> None:
+        """Invoke a status callback, logging rather than propagating its errors."""
+        try:
+            callback(status, data)
+        except Exception as e:
+            self.logger.error(f"Error in status callback: {e}")
     
     def validate_stream_url(self) -> bool:
         """
@@ -98,39 +290,52 @@ class StreamRecorder:
         Returns:
             True if URL is valid and accessible, False otherwise
         """
+        is_valid, error_message = self._validate_url(self.stream_url, self._get_url_scheme)
+        if not is_valid:
+            self.error_message = error_message
+        return is_valid
+    
+    def _validate_url(self, stream_url: str, get_scheme: Optional[Callable[[], str]] = None) -> Tuple[bool, Optional[str]]:
+        """
+        Validate a stream URL without touching the recorder's own state.
+        
+        Args:
+            stream_url: URL to validate
+            get_scheme: Optional callable returning the URL's already parsed scheme
+            
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
         try:
-            parsed_url = urlparse(self.stream_url)
+            scheme = get_scheme() if get_scheme else urlparse(stream_url).scheme
             
             # Check protocol support
-            supported_protocols = ['http', 'https', 'rtmp', 'rtmps']
-            if parsed_url.scheme.lower() not in supported_protocols:
-                self.error_message = f"Unsupported protocol: {parsed_url.scheme}"
-                return False
+            check_name = self._SCHEME_CHECKS.get(scheme.lower())
+            if check_name is None:
+                return False, f"Unsupported protocol: {scheme}"
             
-            # For HTTP/HTTPS streams, test connectivity
-            if parsed_url.scheme.lower() in ['http', 'https']:
-                return self._test_http_stream()
+            # A recent successful check, possibly by another recorder, still holds
+            if _recently_validated(stream_url):
+                return True, None
             
-            # For RTMP streams, we'll rely on FFmpeg to validate
-            elif parsed_url.scheme.lower() in ['rtmp', 'rtmps']:
-                return self._test_rtmp_stream()
-            
-            return True
+            is_valid, error_message = getattr(self, check_name)(stream_url)
+            if is_valid:
+                _remember_validation(stream_url)
+            return is_valid, error_message
             
         except Exception as e:
-            self.error_message = f"URL validation error: {str(e)}"
-            self.logger.error(self.error_message)
-            return False
+            error_message = f"URL validation error: {str(e)}"
+            self.logger.error(error_message)
+            return False, error_message
     
-    def _test_http_stream(self) -> bool:
+    def _test_http_stream(self, stream_url: str) -> Tuple[bool, Optional[str]]:
         """Test HTTP/HTTPS stream connectivity."""
         try:
-            # Send HEAD request to test connectivity
-            response = requests.head(
-                self.stream_url,
-                timeout=10,
-                allow_redirects=True,
-                headers={'User-Agent': 'AudioStreamRecorder/1.0'}
+            # Send HEAD request to test connectivity, reusing pooled connections
+            response = _get_http_session().head(
+                stream_url,
+                timeout=HTTP_CHECK_TIMEOUT,
+                allow_redirects=True
             )
             
             if response.status_code == 200:
@@ -138,58 +343,63 @@ class StreamRecorder:
                 content_type = response.headers.get('content-type', '').lower()
                 audio_types = ['audio/', 'application/ogg', 'video/mp2t']
                 
-                if any(audio_type in content_type for audio_type in audio_types):
-                    return True
-                else:
+                if not any(audio_type in content_type for audio_type in audio_types):
+                    # Still allow, FFmpeg might handle it
                     self.logger.warning(f"Content type may not be audio: {content_type}")
-                    return True  # Still allow, FFmpeg might handle it
+                return True, None
             else:
-                self.error_message = f"HTTP error: {response.status_code}"
-                return False
+                return False, f"HTTP error: {response.status_code}"
                 
         except requests.exceptions.RequestException as e:
-            self.error_message = f"Connection test failed: {str(e)}"
-            self.logger.error(self.error_message)
-            return False
+            error_message = f"Connection test failed: {str(e)}"
+            self.logger.error(error_message)
+            return False, error_message
     
-    def _test_rtmp_stream(self) -> bool:
+    def _test_rtmp_stream(self, stream_url: str) -> Tuple[bool, Optional[str]]:
         """Test RTMP stream connectivity using FFmpeg probe."""
         try:
-            # Use FFprobe to test RTMP stream
+            # Use FFprobe to test RTMP stream; listing just the stream types
+            # needs only a short probe rather than seconds of buffered data
             cmd = [
-                'ffprobe',
-                '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_streams',
-                '-analyzeduration', '5000000',  # 5 seconds
-                '-probesize', '5000000',
-                self.stream_url
+                resolve_executable('ffprobe'),
+                '-v', 'error',
+                '-fflags', '+nobuffer',
+                '-analyzeduration', '500000',  # 0.5 seconds
+                '-probesize', '100000',
+                '-rw_timeout', '5000000',
+                '-show_entries', 'stream=codec_type',
+                '-of', 'csv=p=0',
+                stream_url
             ]
             
+            # Output is tiny and mostly unused, so skip text decoding
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=15
             )
             
-            if result.returncode == 0:
-                return True
-            else:
-                self.error_message = f"RTMP stream test failed: {result.stderr}"
-                return False
+            if result.returncode != 0:
+                stderr_tail = (result.stderr or b'')[-2048:].decode('utf-8', 'replace')
+                return False, f"RTMP stream test failed: {stderr_tail}"
+            
+            if b'audio' not in result.stdout.split():
+                return False, "RTMP stream test failed: no audio stream found"
+            
+            return True, None
                 
         except subprocess.TimeoutExpired:
-            self.error_message = "RTMP stream test timed out"
-            return False
+            return False, "RTMP stream test timed out"
         except Exception as e:
-            self.error_message = f"RTMP test error: {str(e)}"
-            return False
+            return False, f"RTMP test error: {str(e)}"
     
     def test_stream_connection(self, stream_url: str) -> dict:
         """
         Test a stream URL connection without creating a full recorder instance.
         
+        The recorder's own URL and error state are left untouched, so this is
+        safe to call while it is recording.
+        
         Args:
             stream_url: The stream URL to test
             
@@ -197,15 +407,7 @@ class StreamRecorder:
             Dictionary with test results
         """
         try:
-            # Temporarily set the stream URL for testing
-            original_url = self.stream_url
-            self.stream_url = stream_url
-            
-            # Run validation
-            is_valid = self.validate_stream_url()
-            
-            # Restore original URL
-            self.stream_url = original_url
+            is_valid, error_message = self._validate_url(stream_url)
             
             if is_valid:
                 return {
@@ -215,7 +417,7 @@ class StreamRecorder:
             else:
                 return {
                     'success': False,
-                    'message': self.error_message or 'Stream URL validation failed'
+                    'message': error_message or 'Stream URL validation failed'
                 }
                 
         except Exception as e:
@@ -224,6 +426,26 @@ class StreamRecorder:
                 'message': f'Test failed: {str(e)}'
             }
     
+    @classmethod
+    def test_stream_connections(cls, stream_urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Test several stream URLs concurrently over the shared HTTP session.
+        
+        Args:
+            stream_urls: Stream URLs to test
+            
+        Returns:
+            List of test results, in the same order as stream_urls
+        """
+        if not stream_urls:
+            return []
+        
+        # Checks leave the tester untouched, so one instance serves all threads
+        tester = cls(stream_url=stream_urls[0], output_path=os.devnull)
+        max_workers = min(STREAM_CHECK_MAX_WORKERS, len(stream_urls))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stream-check") as executor:
+            return list(executor.map(tester.test_stream_connection, stream_urls))
+    
     def start_recording(self) -> bool:
         """
         Start recording the audio stream.
@@ -242,10 +464,8 @@ class StreamRecorder:
             self._update_status(RecordingStatus.FAILED)
             return False
         
-        # Start recording in a separate thread
-        self.recording_thread = threading.Thread(target=self._record_stream)
-        self.recording_thread.daemon = True
-        self.recording_thread.start()
+        # Start recording on the shared recording pool
+        self.recording_future = _get_recording_executor().submit(self._record_stream)
         
         return True
     
@@ -259,33 +479,65 @@ class StreamRecorder:
             cmd = self._build_ffmpeg_command()
             self.logger.info(f"Starting FFmpeg with command: {' '.join(cmd)}")
             
-            # Start FFmpeg process
+            # Start FFmpeg process; it writes the recording to a file, so only
+            # stderr needs a pipe
             self.process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
-                text=True,
-                preexec_fn=os.setsid  # Create new process group for clean termination
+                start_new_session=True  # New session and process group for clean termination
             )
             
+            # Open the wake pipe before the drain thread can signal EOF on it
+            self._open_wake_pipe()
+            
+            if self.process.stderr:
+                self._stderr_thread = threading.Thread(
+                    target=self._drain_stderr,
+                    args=(self.process.stderr,),
+                    name="ffmpeg-stderr",
+                    daemon=True
+                )
+                self._stderr_thread.start()
+            
             # Monitor the recording process
             self._monitor_recording()
             
         except Exception as e:
             self.error_message = f"Recording error: {str(e)}"
             self.logger.error(self.error_message)
+            _forget_validation(self.stream_url)
             self._update_status(RecordingStatus.FAILED)
     
     def _build_ffmpeg_command(self) -> list:
         """Build FFmpeg command for recording."""
         cmd = [
-            config.FFMPEG_PATH,
+            resolve_executable(config.FFMPEG_PATH),
             '-y',  # Overwrite output file
+            '-loglevel', config.FFMPEG_LOGLEVEL,
+            # Input options: radio codecs are known up front, so skip most of
+            # the probing that otherwise delays the first byte by seconds
+            '-fflags', '+nobuffer',
+            '-probesize', config.FFMPEG_PROBESIZE,
+            '-analyzeduration', config.FFMPEG_ANALYZEDURATION,
+            '-rw_timeout', config.FFMPEG_RW_TIMEOUT,
+        ]
+        
+        # Reconnect options are only understood by the HTTP protocol
+        if self._get_url_scheme().lower() in ('http', 'https'):
+            cmd.extend([
+                '-reconnect', '1',
+                '-reconnect_streamed', '1',
+                '-reconnect_delay_max', '5',
+            ])
+        
+        cmd.extend([
             '-i', self.stream_url,
             '-acodec', 'libmp3lame',  # Use MP3 encoder for audio
             '-ab', '128k',  # Audio bitrate
             '-f', 'mp3',   # Force MP3 output format
-        ]
+        ])
         
         # Add duration limit if specified
         if self.duration_minutes:
@@ -297,43 +549,119 @@ class StreamRecorder:
         
         return cmd
     
+    def _drain_stderr(self, stream) -> None:
+        """Read FFmpeg stderr until EOF, keeping only the most recent lines."""
+        try:
+            for line in stream:
+                self._stderr_tail.append(line.decode('utf-8', 'replace'))
+        except (OSError, ValueError):
+            # Pipe closed underneath us during cleanup
+            pass
+        finally:
+            # EOF means FFmpeg is exiting; let the monitor notice right away
+            self._stderr_eof.set()
+            self._wake()
+    
+    def _open_wake_pipe(self) -> None:
+        """Create the monitor's wake pipe if it isn't open yet."""
+        with self._wake_lock:
+            if self._wake_r is None:
+                self._wake_r, self._wake_w = os.pipe()
+                os.set_blocking(self._wake_r, False)
+                os.set_blocking(self._wake_w, False)
+    
+    def _close_wake_pipe(self) -> None:
+        """Close the monitor's wake pipe."""
+        with self._wake_lock:
+            for fd in (self._wake_r, self._wake_w):
+                if fd is not None:
+                    os.close(fd)
+            self._wake_r = self._wake_w = None
+    
+    def _wake(self) -> None:
+        """Wake the monitor if it is waiting."""
+        with self._wake_lock:
+            if self._wake_w is not None:
+                try:
+                    os.write(self._wake_w, b'x')
+                except BlockingIOError:
+                    # Pipe already full of unread wake-ups
+                    pass
+    
+    def _wait_for_wake(self, timeout: float) -> None:
+        """
+        Block until woken or the timeout expires, without periodic polling.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+        """
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._wake_r, selectors.EVENT_READ)
+            if selector.select(timeout):
+                try:
+                    os.read(self._wake_r, 4096)
+                except BlockingIOError:
+                    pass
+    
     def _monitor_recording(self) -> None:
         """Monitor the recording process and handle duration limits."""
         if not self.process:
             return
         
-        # Calculate end time if duration is specified
-        end_time = None
+        # Calculate the deadline on the monotonic clock if duration is specified,
+        # so wall-clock adjustments and DST changes don't shorten or extend it
+        deadline = None
         if self.duration_minutes:
-            end_time = self.start_time + timedelta(minutes=self.duration_minutes)
-        
-        # Monitor process
-        while self.process.poll() is None:
-            # Check if we should stop
-            if self.stop_event.is_set():
-                self.logger.info("Stop event received, terminating recording")
-                self._terminate_process()
-                break
-            
-            # Check duration limit
-            if end_time and datetime.now() >= end_time:
-                self.logger.info("Duration limit reached, stopping recording")
-                self._terminate_process()
-                break
-            
-            # Update file size if file exists
-            if os.path.exists(self.output_path):
-                try:
-                    self.bytes_recorded = os.path.getsize(self.output_path)
-                except OSError:
-                    pass
+            deadline = time.monotonic() + self.duration_minutes * 60
+        
+        # Output file, opened once FFmpeg has created it so each size update
+        # is a single fstat
+        output_fd = None
+        self._open_wake_pipe()
+        
+        try:
+            # Monitor process
+            while self.process.poll() is None:
+                # Check if we should stop
+                if self.stop_event.is_set():
+                    self.logger.info("Stop event received, terminating recording")
+                    self._terminate_process()
+                    break
+                
+                # Check duration limit
+                wait_seconds = MONITOR_MAX_WAIT_SECONDS
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.logger.info("Duration limit reached, stopping recording")
+                        self._terminate_process()
+                        break
+                    # Wake exactly at the deadline
+                    wait_seconds = min(wait_seconds, remaining)
+                
+                output_fd = self._update_bytes_recorded(output_fd)
+                
+                if self._stderr_eof.is_set():
+                    # stderr is closed, so FFmpeg is already exiting
+                    try:
+                        self.process.wait(timeout=wait_seconds)
+                    except subprocess.TimeoutExpired:
+                        pass
+                else:
+                    # Sleep until stop_recording(), FFmpeg exit or the deadline
+                    self._wait_for_wake(wait_seconds)
             
-            # Sleep briefly before next check
-            time.sleep(1)
+            output_fd = self._update_bytes_recorded(output_fd)
+        finally:
+            if output_fd is not None:
+                os.close(output_fd)
+            self._close_wake_pipe()
         
-        # Process has finished
+        # Process has finished; collect what the drain thread read
         return_code = self.process.returncode
-        stderr_output = self.process.stderr.read() if self.process.stderr else ""
+        if self._stderr_thread:
+            self._stderr_thread.join(timeout=5)
+        stderr_output = "".join(self._stderr_tail)
         
         self.end_time = datetime.now()
         
@@ -343,8 +671,28 @@ class StreamRecorder:
         else:
             self.error_message = f"FFmpeg failed with return code {return_code}: {stderr_output}"
             self.logger.error(self.error_message)
+            _forget_validation(self.stream_url)
             self._update_status(RecordingStatus.FAILED)
     
+    def _update_bytes_recorded(self, output_fd: Optional[int]) -> Optional[int]:
+        """
+        Refresh bytes_recorded from the output file.
+        
+        Args:
+            output_fd: Descriptor of the output file, or None if not opened yet
+            
+        Returns:
+            Descriptor to pass on the next call
+        """
+        try:
+            if output_fd is None:
+                output_fd = os.open(self.output_path, os.O_RDONLY | os.O_CLOEXEC)
+            self.bytes_recorded = os.fstat(output_fd).st_size
+        except OSError:
+            # FFmpeg hasn't created the file yet
+            pass
+        return output_fd
+    
     def _terminate_process(self) -> None:
         """Terminate the FFmpeg process gracefully."""
         if self.process and self.process.poll() is None:
@@ -377,12 +725,13 @@ class StreamRecorder:
         
         self._update_status(RecordingStatus.STOPPING)
         self.stop_event.set()
+        self._wake()
         
         # Wait for recording thread to finish
-        if self.recording_thread and self.recording_thread.is_alive():
-            self.recording_thread.join(timeout=10)
-            
-            if self.recording_thread.is_alive():
+        if self.recording_future and not self.recording_future.done():
+            try:
+                self.recording_future.result(timeout=10)
+            except FutureTimeoutError:
                 self.logger.warning("Recording thread didn't finish within timeout")
         
         return True
@@ -394,6 +743,13 @@ class StreamRecorder:
         Returns:
             Dictionary with recording status and metadata
         """
+        # The monitor only wakes on events, so refresh the size for live recordings
+        if self.status == RecordingStatus.RECORDING:
+            try:
+                self.bytes_recorded = os.stat(self.output_path).st_size
+            except OSError:
+                pass
+        
         duration = None
         if self.start_time:
             end = self.end_time or datetime.now()
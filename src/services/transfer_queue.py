@@ -4,23 +4,54 @@ Provides queue system for retry attempts and transfer status tracking.
 """
 
 import os
+import itertools
 import json
 import time
 import threading
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from queue import Queue, Empty
 import sqlite3
 
-from .scp_transfer_service import SCPTransferService, TransferResult, TransferStatus, SCPConfig
+from .scp_transfer_service import SCPTransferService, TransferResult, TransferStatus, SCPConfig, local_file_size
 from ..config import config
 
 
-@dataclass
+# Per-connection settings; WAL itself is persistent and set once on the file.
+# NORMAL sync is safe under WAL and skips an fsync per commit
+_CONNECTION_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-20000',  # KiB
+    'PRAGMA mmap_size=268435456',
+)
+
+
+def _to_millis(value: datetime) -> int:
+    """Convert a local datetime to the integer Unix milliseconds stored in the database."""
+    return int(value.timestamp() * 1000)
+
+
+def _from_millis(value: int) -> datetime:
+    """Convert stored Unix milliseconds back to a local datetime."""
+    return datetime.fromtimestamp(value / 1000)
+
+
+# Longest the worker sleeps with nothing due; new and retried transfers wake it
+WORKER_MAX_WAIT_SECONDS = 30
+
+# Part of every transfer ID, so adds in the same millisecond never share one
+_transfer_sequence = itertools.count(1)
+
+# Rows deleted per transaction by cleanup, so workers can write in between
+CLEANUP_BATCH_SIZE = 1000
+
+
+# Slotted: no per-instance __dict__ for what can be a large backlog after an outage
+@dataclass(slots=True)
 class QueuedTransfer:
     """Represents a queued transfer operation."""
     id: str
@@ -35,11 +66,24 @@ class QueuedTransfer:
     metadata: Optional[Dict[str, Any]] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        data = asdict(self)
-        data['created_at'] = self.created_at.isoformat()
-        data['scheduled_at'] = self.scheduled_at.isoformat()
-        return data
+        """
+        Convert to dictionary for serialization.
+        
+        The dictionary is shallow: metadata is the transfer's own dict, not a
+        copy, so callers must not modify it.
+        """
+        return {
+            'id': self.id,
+            'local_path': self.local_path,
+            'scp_destination': self.scp_destination,
+            'created_at': self.created_at.isoformat(),
+            'scheduled_at': self.scheduled_at.isoformat(),
+            'retry_count': self.retry_count,
+            'max_retries': self.max_retries,
+            'last_error': self.last_error,
+            'priority': self.priority,
+            'metadata': self.metadata
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'QueuedTransfer':
@@ -66,28 +110,66 @@ class TransferQueue:
         self.db_path = db_path or os.path.join('data', 'transfer_queue.db')
         self.scp_service = SCPTransferService()
         
-        # Thread-safe queue and locks
-        self._queue: Queue[QueuedTransfer] = Queue()
-        self._queue_lock = threading.Lock()
+        # The database is the queue; workers claim due rows from it and are
+        # woken when transfers are added or retried
+        self._wake_event = threading.Event()
         self._running = False
-        self._worker_thread: Optional[threading.Thread] = None
+        self._worker_threads: List[threading.Thread] = []
+        
+        # Exponential backoff delays for the usual retry counts, built once
+        self._retry_delays: Tuple[timedelta, ...] = tuple(
+            timedelta(seconds=config.RETRY_DELAY_SECONDS * (1 << attempt))
+            for attempt in range(config.DEFAULT_MAX_RETRIES)
+        )
+        
+        # One long-lived connection per thread; sqlite3 connections can't be shared
+        self._local = threading.local()
         
         # Initialize database
         self._init_database()
-        self._load_queue_from_db()
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get this thread's database connection, opening it on first use."""
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._local.connection = conn
+        return conn
+    
+    def close(self) -> None:
+        """Close the calling thread's database connection."""
+        conn = getattr(self._local, 'connection', None)
+        if conn is not None:
+            self._local.connection = None
+            conn.close()
     
     def _init_database(self) -> None:
         """Initialize SQLite database for persistent queue storage."""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('BEGIN IMMEDIATE')
+            
+            # Queues written before timestamps became Unix millis keep ISO
+            # strings in TEXT columns; rebuild the table with INTEGER ones
+            columns = {row['name']: row['type'] for row in conn.execute('PRAGMA table_info(transfer_queue)')}
+            migrate_timestamps = columns.get('created_at') == 'TEXT'
+            if migrate_timestamps:
+                conn.execute('ALTER TABLE transfer_queue RENAME TO transfer_queue_iso')
+            
+            # Timestamps are Unix milliseconds, so comparisons and the
+            # scheduled_at indexes work on fixed-size integers
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS transfer_queue (
                     id TEXT PRIMARY KEY,
                     local_path TEXT NOT NULL,
                     scp_destination TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    scheduled_at TEXT NOT NULL,
+                    created_at INTEGER NOT NULL,
+                    scheduled_at INTEGER NOT NULL,
                     retry_count INTEGER DEFAULT 0,
                     max_retries INTEGER DEFAULT 3,
                     last_error TEXT,
@@ -97,6 +179,9 @@ class TransferQueue:
                 )
             ''')
             
+            if migrate_timestamps:
+                self._copy_iso_rows(conn)
+            
             conn.execute('''
                 CREATE INDEX IF NOT EXISTS idx_scheduled_at ON transfer_queue(scheduled_at)
             ''')
@@ -105,61 +190,142 @@ class TransferQueue:
                 CREATE INDEX IF NOT EXISTS idx_priority ON transfer_queue(priority DESC)
             ''')
             
+            # Covers the worker's "next due queued transfer" lookup
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_status_sched ON transfer_queue(status, scheduled_at, priority)
+            ''')
+            
+            # Lets cleanup find old completed rows without a table scan
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_completed_created ON transfer_queue(created_at)
+                WHERE status = 'completed'
+            ''')
+            
             conn.commit()
     
-    def _load_queue_from_db(self) -> None:
-        """Load pending transfers from database into memory queue."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute('''
+    def _copy_iso_rows(self, conn: sqlite3.Connection) -> None:
+        """Move rows from the old ISO-timestamp table into transfer_queue and drop it."""
+        rows = []
+        for row in conn.execute('SELECT * FROM transfer_queue_iso'):
+            row_data = dict(row)
+            row_data['created_at'] = _to_millis(datetime.fromisoformat(row_data['created_at']))
+            row_data['scheduled_at'] = _to_millis(datetime.fromisoformat(row_data['scheduled_at']))
+            rows.append(row_data)
+        
+        conn.executemany('''
+            INSERT INTO transfer_queue 
+            (id, local_path, scp_destination, created_at, scheduled_at, 
+             retry_count, max_retries, last_error, priority, metadata, status)
+            VALUES (:id, :local_path, :scp_destination, :created_at, :scheduled_at,
+                    :retry_count, :max_retries, :last_error, :priority, :metadata, :status)
+        ''', rows)
+        # Dropping the old table also drops its indexes, freeing their names
+        conn.execute('DROP TABLE transfer_queue_iso')
+        self.logger.info(f"Migrated {len(rows)} queued transfers to millisecond timestamps")
+    
+    @staticmethod
+    def _row_to_transfer(row: sqlite3.Row) -> QueuedTransfer:
+        """Build a QueuedTransfer from a transfer_queue row."""
+        transfer_data = dict(row)
+        transfer_data['created_at'] = _from_millis(transfer_data['created_at'])
+        transfer_data['scheduled_at'] = _from_millis(transfer_data['scheduled_at'])
+        # Parse metadata if present
+        if transfer_data['metadata']:
+            transfer_data['metadata'] = json.loads(transfer_data['metadata'])
+        else:
+            transfer_data['metadata'] = None
+        
+        # Remove status field as it's not part of QueuedTransfer
+        del transfer_data['status']
+        return QueuedTransfer(**transfer_data)
+    
+    def _retry_delay(self, retry_count: int) -> timedelta:
+        """
+        Get the backoff delay before a retry.
+        
+        Args:
+            retry_count: Number of attempts that have failed so far (1 or more)
+            
+        Returns:
+            Delay doubling from RETRY_DELAY_SECONDS with each failed attempt
+        """
+        if retry_count <= len(self._retry_delays):
+            return self._retry_delays[retry_count - 1]
+        # Transfers may allow more retries than the default
+        return timedelta(seconds=config.RETRY_DELAY_SECONDS * (1 << (retry_count - 1)))
+    
+    def _claim_next_transfer(self) -> Tuple[Optional[QueuedTransfer], Optional[datetime]]:
+        """
+        Claim the highest priority due transfer by marking it as processing.
+        
+        Returns:
+            Tuple of (claimed transfer, None), or (None, when the next queued
+            transfer is due) if nothing is due yet; both None if the queue is empty
+        """
+        now = int(time.time() * 1000)
+        with self._get_connection() as conn:
+            # Select and mark in one write transaction so a transfer is claimed once
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute('''
                 SELECT * FROM transfer_queue 
                 WHERE status = 'queued' AND scheduled_at <= ?
                 ORDER BY priority DESC, scheduled_at ASC
-            ''', (datetime.now().isoformat(),))
+                LIMIT 1
+            ''', (now,)).fetchone()
             
-            for row in cursor:
-                transfer_data = dict(row)
-                # Parse metadata if present
-                if transfer_data['metadata']:
-                    transfer_data['metadata'] = json.loads(transfer_data['metadata'])
-                else:
-                    transfer_data['metadata'] = None
-                
-                # Remove status field as it's not part of QueuedTransfer
-                del transfer_data['status']
-                
-                queued_transfer = QueuedTransfer.from_dict(transfer_data)
-                self._queue.put(queued_transfer)
-                
-                self.logger.debug(f"Loaded queued transfer: {queued_transfer.id}")
+            if row is None:
+                next_due = conn.execute(
+                    "SELECT MIN(scheduled_at) FROM transfer_queue WHERE status = 'queued'"
+                ).fetchone()[0]
+                return None, _from_millis(next_due) if next_due is not None else None
+            
+            conn.execute("UPDATE transfer_queue SET status = 'processing' WHERE id = ?", (row['id'],))
+        
+        return self._row_to_transfer(row), None
     
-    def _save_transfer_to_db(self, transfer: QueuedTransfer, status: str = 'queued') -> None:
-        """Save transfer to database."""
-        with sqlite3.connect(self.db_path) as conn:
-            metadata_json = json.dumps(transfer.metadata) if transfer.metadata else None
+    def _save_transfers_to_db(self, transfers: List[Tuple[QueuedTransfer, str]]) -> None:
+        """
+        Save several new transfers to the database in one transaction.
+        
+        Args:
+            transfers: (transfer, status) pairs to insert
             
-            conn.execute('''
-                INSERT OR REPLACE INTO transfer_queue 
+        Raises:
+            sqlite3.IntegrityError: If a transfer ID already exists; nothing is saved
+        """
+        rows = (
+            (
+                transfer.id, transfer.local_path, transfer.scp_destination,
+                _to_millis(transfer.created_at), _to_millis(transfer.scheduled_at),
+                transfer.retry_count, transfer.max_retries, transfer.last_error,
+                transfer.priority,
+                # Compact separators keep rows (and WAL pages) small
+                json.dumps(transfer.metadata, separators=(',', ':')) if transfer.metadata else None,
+                status
+            )
+            for transfer, status in transfers
+        )
+        
+        with self._get_connection() as conn:
+            # One write lock and one commit for the whole batch
+            conn.execute('BEGIN IMMEDIATE')
+            conn.executemany('''
+                INSERT INTO transfer_queue 
                 (id, local_path, scp_destination, created_at, scheduled_at, 
                  retry_count, max_retries, last_error, priority, metadata, status)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                transfer.id, transfer.local_path, transfer.scp_destination,
-                transfer.created_at.isoformat(), transfer.scheduled_at.isoformat(),
-                transfer.retry_count, transfer.max_retries, transfer.last_error,
-                transfer.priority, metadata_json, status
-            ))
+            ''', rows)
             conn.commit()
     
     def _remove_transfer_from_db(self, transfer_id: str) -> None:
         """Remove transfer from database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             conn.execute('DELETE FROM transfer_queue WHERE id = ?', (transfer_id,))
             conn.commit()
     
     def _update_transfer_status_in_db(self, transfer_id: str, status: str, last_error: Optional[str] = None) -> None:
         """Update transfer status in database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             if last_error:
                 conn.execute('''
                     UPDATE transfer_queue 
@@ -174,6 +340,16 @@ class TransferQueue:
                 ''', (status, transfer_id))
             conn.commit()
     
+    def _reschedule_transfer_in_db(self, transfer: QueuedTransfer) -> None:
+        """Requeue a failed transfer, writing only the fields a retry changes."""
+        with self._get_connection() as conn:
+            conn.execute('''
+                UPDATE transfer_queue 
+                SET status = 'queued', retry_count = ?, scheduled_at = ?, last_error = ? 
+                WHERE id = ?
+            ''', (transfer.retry_count, _to_millis(transfer.scheduled_at), transfer.last_error, transfer.id))
+            conn.commit()
+    
     def add_transfer(
         self,
         local_path: str,
@@ -197,35 +373,62 @@ class TransferQueue:
         Returns:
             Transfer ID
         """
-        if not os.path.exists(local_path):
-            raise FileNotFoundError(f"Local file not found: {local_path}")
+        return self.add_transfers([{
+            'local_path': local_path,
+            'scp_destination': scp_destination,
+            'priority': priority,
+            'max_retries': max_retries,
+            'metadata': metadata,
+            'delay_seconds': delay_seconds
+        }])[0]
+    
+    def add_transfers(self, transfers: List[Dict[str, Any]]) -> List[str]:
+        """
+        Add several transfers to the queue with a single database commit.
+        
+        Args:
+            transfers: Dictionaries of add_transfer keyword arguments
+                (local_path and scp_destination are required)
+            
+        Returns:
+            Transfer IDs, in the same order as transfers
+            
+        Raises:
+            FileNotFoundError: If any local file is missing; nothing is queued
+        """
+        for transfer in transfers:
+            if not os.path.exists(transfer['local_path']):
+                raise FileNotFoundError(f"Local file not found: {transfer['local_path']}")
         
-        transfer_id = f"transfer_{int(time.time() * 1000)}_{os.path.basename(local_path)}"
         now = datetime.now()
-        scheduled_at = now + timedelta(seconds=delay_seconds)
-        
-        queued_transfer = QueuedTransfer(
-            id=transfer_id,
-            local_path=local_path,
-            scp_destination=scp_destination,
-            created_at=now,
-            scheduled_at=scheduled_at,
-            retry_count=0,
-            max_retries=max_retries or config.DEFAULT_MAX_RETRIES,
-            priority=priority,
-            metadata=metadata
-        )
+        timestamp = int(time.time() * 1000)
+        queued_transfers: List[QueuedTransfer] = []
+        
+        for transfer in transfers:
+            transfer_id = (
+                f"transfer_{timestamp}_{next(_transfer_sequence)}_{os.path.basename(transfer['local_path'])}"
+            )
+            
+            queued_transfers.append(QueuedTransfer(
+                id=transfer_id,
+                local_path=transfer['local_path'],
+                scp_destination=transfer['scp_destination'],
+                created_at=now,
+                scheduled_at=now + timedelta(seconds=transfer.get('delay_seconds', 0)),
+                retry_count=0,
+                max_retries=transfer.get('max_retries') or config.DEFAULT_MAX_RETRIES,
+                priority=transfer.get('priority', 0),
+                metadata=transfer.get('metadata')
+            ))
         
         # Save to database
-        self._save_transfer_to_db(queued_transfer)
+        self._save_transfers_to_db([(queued_transfer, 'queued') for queued_transfer in queued_transfers])
+        self._wake_event.set()
         
-        # Add to memory queue if scheduled time has passed
-        if scheduled_at <= now:
-            with self._queue_lock:
-                self._queue.put(queued_transfer)
+        for queued_transfer in queued_transfers:
+            self.logger.info(f"Added transfer to queue: {queued_transfer.id} (priority: {queued_transfer.priority})")
         
-        self.logger.info(f"Added transfer to queue: {transfer_id} (priority: {priority})")
-        return transfer_id
+        return [queued_transfer.id for queued_transfer in queued_transfers]
     
     def retry_failed_transfer(self, transfer_id: str, delay_seconds: int = 0) -> bool:
         """
@@ -239,8 +442,7 @@ class TransferQueue:
             True if transfer was queued for retry, False if not found or max retries exceeded
         """
         # Load transfer from database
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             cursor = conn.execute('SELECT * FROM transfer_queue WHERE id = ?', (transfer_id,))
             row = cursor.fetchone()
             
@@ -248,14 +450,7 @@ class TransferQueue:
                 self.logger.warning(f"Transfer not found for retry: {transfer_id}")
                 return False
             
-            transfer_data = dict(row)
-            if transfer_data['metadata']:
-                transfer_data['metadata'] = json.loads(transfer_data['metadata'])
-            else:
-                transfer_data['metadata'] = None
-            
-            del transfer_data['status']  # Remove status field
-            queued_transfer = QueuedTransfer.from_dict(transfer_data)
+            queued_transfer = self._row_to_transfer(row)
         
         # Check if max retries exceeded
         if queued_transfer.retry_count >= queued_transfer.max_retries:
@@ -266,12 +461,9 @@ class TransferQueue:
         queued_transfer.retry_count += 1
         queued_transfer.scheduled_at = datetime.now() + timedelta(seconds=delay_seconds)
         
-        # Save updated transfer
-        self._save_transfer_to_db(queued_transfer)
-        
-        # Add to memory queue
-        with self._queue_lock:
-            self._queue.put(queued_transfer)
+        # Save updated transfer and let the worker pick it up
+        self._reschedule_transfer_in_db(queued_transfer)
+        self._wake_event.set()
         
         self.logger.info(f"Queued transfer for retry: {transfer_id} (attempt {queued_transfer.retry_count})")
         return True
@@ -283,19 +475,19 @@ class TransferQueue:
         Returns:
             Dictionary with queue statistics
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute('SELECT status, COUNT(*) as count FROM transfer_queue GROUP BY status')
-            status_counts = {row[0]: row[1] for row in cursor}
-            
-            cursor = conn.execute('SELECT COUNT(*) FROM transfer_queue WHERE scheduled_at <= ?', 
-                                (datetime.now().isoformat(),))
-            ready_count = cursor.fetchone()[0]
+        # Counts per status and how many are due, in one pass over the table
+        with self._get_connection() as conn:
+            cursor = conn.execute('''
+                SELECT status, COUNT(*), SUM(CASE WHEN scheduled_at <= ? THEN 1 ELSE 0 END)
+                FROM transfer_queue 
+                GROUP BY status
+            ''', (int(time.time() * 1000),))
+            rows = cursor.fetchall()
         
-        with self._queue_lock:
-            memory_queue_size = self._queue.qsize()
+        status_counts = {row[0]: row[1] for row in rows}
+        ready_count = sum(row[2] for row in rows)
         
         return {
-            'memory_queue_size': memory_queue_size,
             'ready_for_processing': ready_count,
             'status_counts': status_counts,
             'worker_running': self._running
@@ -311,23 +503,28 @@ class TransferQueue:
         Returns:
             List of transfer dictionaries
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             cursor = conn.execute('''
                 SELECT * FROM transfer_queue 
                 WHERE status IN ('queued', 'processing', 'failed')
                 ORDER BY priority DESC, scheduled_at ASC
                 LIMIT ?
             ''', (limit,))
+            rows = cursor.fetchall()
             
-            transfers = []
-            for row in cursor:
-                transfer_data = dict(row)
-                if transfer_data['metadata']:
-                    transfer_data['metadata'] = json.loads(transfer_data['metadata'])
-                transfers.append(transfer_data)
-            
-            return transfers
+            # Look the columns up once rather than by name on every row
+            columns = [description[0] for description in cursor.description]
+        
+        transfers = []
+        for row in rows:
+            transfer_data = dict(zip(columns, row))
+            if transfer_data['metadata']:
+                transfer_data['metadata'] = json.loads(transfer_data['metadata'])
+            transfer_data['created_at'] = _from_millis(transfer_data['created_at']).isoformat()
+            transfer_data['scheduled_at'] = _from_millis(transfer_data['scheduled_at']).isoformat()
+            transfers.append(transfer_data)
+        
+        return transfers
     
     def remove_transfer(self, transfer_id: str) -> bool:
         """
@@ -344,25 +541,44 @@ class TransferQueue:
         return True
     
     def start_worker(self) -> None:
-        """Start the background worker thread for processing transfers."""
+        """
+        Start the background worker threads for processing transfers.
+        
+        Runs MAX_CONCURRENT_TRANSFERS workers so transfers to different hosts
+        proceed in parallel; the transfer service still caps transfers per host
+        and gives each in-flight transfer its own pooled SSH connection.
+        """
         if self._running:
-            self.logger.warning("Worker thread is already running")
+            self.logger.warning("Worker threads are already running")
             return
         
+        # Stopped workers shut their transfer service down; start with a fresh one
+        if self.scp_service.is_shut_down:
+            self.scp_service = SCPTransferService()
+        
         self._running = True
-        self._worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
-        self._worker_thread.start()
-        self.logger.info("Started transfer queue worker thread")
+        self._worker_threads = [
+            threading.Thread(target=self._worker_loop, name=f"transfer-worker-{index}", daemon=True)
+            for index in range(max(1, config.MAX_CONCURRENT_TRANSFERS))
+        ]
+        for worker_thread in self._worker_threads:
+            worker_thread.start()
+        self.logger.info(f"Started {len(self._worker_threads)} transfer queue worker threads")
     
     def stop_worker(self) -> None:
-        """Stop the background worker thread."""
+        """Stop the background worker threads."""
         if not self._running:
             return
         
         self._running = False
-        if self._worker_thread:
-            self._worker_thread.join(timeout=5.0)
-        self.logger.info("Stopped transfer queue worker thread")
+        # Wake idle workers and any transfer waiting to retry so they can exit
+        self._wake_event.set()
+        self.scp_service.shutdown()
+        deadline = time.monotonic() + 5.0
+        for worker_thread in self._worker_threads:
+            worker_thread.join(timeout=max(deadline - time.monotonic(), 0.0))
+        self._worker_threads = []
+        self.logger.info("Stopped transfer queue worker threads")
     
     def _worker_loop(self) -> None:
         """Main worker loop for processing queued transfers."""
@@ -370,41 +586,38 @@ class TransferQueue:
         
         while self._running:
             try:
-                # Get next transfer from queue (with timeout to allow checking _running)
-                try:
-                    transfer = self._queue.get(timeout=1.0)
-                except Empty:
-                    continue
+                # Clear before looking, so a transfer added meanwhile still wakes us
+                self._wake_event.clear()
+                transfer, next_due = self._claim_next_transfer()
                 
-                # Check if scheduled time has arrived
-                if transfer.scheduled_at > datetime.now():
-                    # Put back in queue and wait
-                    with self._queue_lock:
-                        self._queue.put(transfer)
-                    time.sleep(1.0)
+                if transfer is None:
+                    # Sleep until the next transfer is due or one is added
+                    timeout = WORKER_MAX_WAIT_SECONDS
+                    if next_due is not None:
+                        timeout = min(timeout, max((next_due - datetime.now()).total_seconds(), 0.0))
+                    self._wake_event.wait(timeout)
                     continue
                 
-                # Check if file still exists
-                if not os.path.exists(transfer.local_path):
+                # Check the file still exists; the same stat gives the transfer its size
+                file_size = local_file_size(transfer.local_path)
+                if file_size is None:
                     self.logger.warning(f"Local file no longer exists: {transfer.local_path}")
                     self._update_transfer_status_in_db(transfer.id, 'failed', 'Local file not found')
                     continue
                 
-                # Update status to processing
-                self._update_transfer_status_in_db(transfer.id, 'processing')
-                
                 # Attempt transfer
                 self.logger.info(f"Processing transfer: {transfer.id} (attempt {transfer.retry_count + 1})")
                 
                 result = self.scp_service.transfer_file(
                     local_path=transfer.local_path,
-                    scp_destination=transfer.scp_destination
+                    scp_destination=transfer.scp_destination,
+                    file_size=file_size
                 )
                 
                 if result.success:
                     # Transfer successful
+                    # The row is removed anyway, so skip marking it completed first
                     self.logger.info(f"Transfer completed successfully: {transfer.id}")
-                    self._update_transfer_status_in_db(transfer.id, 'completed')
                     self._remove_transfer_from_db(transfer.id)
                 else:
                     # Transfer failed
@@ -413,17 +626,15 @@ class TransferQueue:
                     
                     if transfer.retry_count < transfer.max_retries:
                         # Schedule retry with exponential backoff
-                        delay = config.RETRY_DELAY_SECONDS * (2 ** (transfer.retry_count - 1))
-                        transfer.scheduled_at = datetime.now() + timedelta(seconds=delay)
+                        delay = self._retry_delay(transfer.retry_count)
+                        transfer.scheduled_at = datetime.now() + delay
                         
                         self.logger.warning(
                             f"Transfer failed, scheduling retry: {transfer.id} "
-                            f"(attempt {transfer.retry_count}/{transfer.max_retries}) in {delay}s"
+                            f"(attempt {transfer.retry_count}/{transfer.max_retries}) in {delay.total_seconds():.0f}s"
                         )
                         
-                        self._save_transfer_to_db(transfer, 'queued')
-                        with self._queue_lock:
-                            self._queue.put(transfer)
+                        self._reschedule_transfer_in_db(transfer)
                     else:
                         # Max retries exceeded
                         self.logger.error(f"Transfer failed permanently: {transfer.id} - {result.error_message}")
@@ -433,6 +644,7 @@ class TransferQueue:
                 self.logger.error(f"Error in transfer worker loop: {str(e)}", exc_info=True)
                 time.sleep(1.0)
         
+        self.close()
         self.logger.info("Transfer queue worker stopped")
     
     def cleanup_completed_transfers(self, older_than_days: int = 7) -> int:
@@ -446,15 +658,26 @@ class TransferQueue:
             Number of transfers removed
         """
         cutoff_date = datetime.now() - timedelta(days=older_than_days)
+        removed_count = 0
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute('''
-                DELETE FROM transfer_queue 
-                WHERE status = 'completed' AND created_at < ?
-            ''', (cutoff_date.isoformat(),))
+        while True:
+            # Each batch commits on its own so the write lock is held briefly
+            with self._get_connection() as conn:
+                cursor = conn.execute('''
+                    DELETE FROM transfer_queue 
+                    WHERE rowid IN (
+                        SELECT rowid FROM transfer_queue 
+                        WHERE status = 'completed' AND created_at < ?
+                        LIMIT ?
+                    )
+                ''', (_to_millis(cutoff_date), CLEANUP_BATCH_SIZE))
+                
+                batch_count = cursor.rowcount
+                conn.commit()
             
-            removed_count = cursor.rowcount
-            conn.commit()
+            removed_count += batch_count
+            if batch_count < CLEANUP_BATCH_SIZE:
+                break
         
         if removed_count > 0:
             self.logger.info(f"Cleaned up {removed_count} completed transfers older than {older_than_days} days")
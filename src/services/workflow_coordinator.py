@@ -4,15 +4,17 @@ Connects scheduler to recording components, audio processing, and file transfer.
 """
 
 import logging
+import os
 import threading
 import time
 from typing import Dict, Optional, Any, Callable
 from datetime import datetime
 
-from .recording_session_manager import RecordingSessionManager
+from .recording_session_manager import RecordingSessionManager, WorkflowStage
 from .scheduler_service import SchedulerService
 from .transfer_queue import TransferQueue
 from .backup_service import BackupService
+from .logging_service import OperationType, LogLevel
 from ..models.recording_schedule import RecordingSchedule
 from ..models.recording_session import RecordingSession, RecordingStatus
 from ..models.stream_configuration import StreamConfiguration
@@ -21,6 +23,14 @@ from ..models.database import DatabaseManager
 from ..config import config
 
 
+# Workflow stages after which a session no longer holds a recording slot
+_FINAL_STAGE_VALUES = frozenset({
+    WorkflowStage.COMPLETED.value,
+    WorkflowStage.FAILED.value,
+    WorkflowStage.CANCELLED.value
+})
+
+
 class WorkflowCoordinator:
     """
     Coordinates the complete recording workflow between all services.
@@ -65,7 +75,8 @@ class WorkflowCoordinator:
         self._last_backup_time = None
         self._backup_interval_hours = 24  # Create backup every 24 hours
         
-        # Active recording sessions
+        # Active recording sessions; only writers take _sessions_lock, since
+        # single dict reads and copies are atomic under the GIL
         self.active_sessions: Dict[int, RecordingSessionManager] = {}
         self._sessions_lock = threading.Lock()
         
@@ -102,7 +113,6 @@ class WorkflowCoordinator:
             
             # Log workflow start
             if self.logging_service:
-                from .logging_service import OperationType, LogLevel
                 self.logging_service.log_operation(
                     OperationType.RECORDING,
                     f"Starting recording workflow for session {session_id}",
@@ -157,7 +167,7 @@ class WorkflowCoordinator:
             
             raise
     
-    def _handle_recording_status_change(self, session_id: int, stage: str, data: Dict[str, Any]):
+    def _handle_recording_status_change(self, session_id: int, stage: WorkflowStage, data: Dict[str, Any]):
         """
         Handle recording workflow stage changes.
         
@@ -169,10 +179,23 @@ class WorkflowCoordinator:
         try:
             self.logger.info(f"Recording session {session_id} stage changed to: {stage}")
             
-            # Handle completion
-            if stage == "completed":
-                self._handle_recording_completion(session_id, True, data.get('output_file'))
-            elif stage == "failed":
+            stage_value = getattr(stage, 'value', stage)
+            
+            # Free the scheduler's recording slot and tracking once the workflow is over
+            if stage_value in _FINAL_STAGE_VALUES:
+                self.scheduler_service.remove_completed_session(session_id)
+            
+            # Handle completion; the session manager uploads the file itself,
+            # so only a file it couldn't transfer goes to the transfer queue
+            if stage_value == WorkflowStage.COMPLETED.value:
+                self._handle_recording_completion(
+                    session_id,
+                    True,
+                    data.get('processed_mp3_path'),
+                    transferred=data.get('transferred', False),
+                    file_size=data.get('file_size_bytes')
+                )
+            elif stage_value == WorkflowStage.FAILED.value:
                 self._handle_recording_completion(session_id, False, None)
             
         except Exception as e:
@@ -182,7 +205,9 @@ class WorkflowCoordinator:
         self, 
         session_id: int, 
         success: bool, 
-        output_file: Optional[str]
+        output_file: Optional[str],
+        transferred: bool = False,
+        file_size: Optional[int] = None
     ):
         """
         Handle completion of a recording session.
@@ -191,6 +216,8 @@ class WorkflowCoordinator:
             session_id: Session ID that completed
             success: Whether recording was successful
             output_file: Path to output file if successful
+            transferred: Whether the file was already uploaded, so it isn't queued again
+            file_size: Size of an already uploaded file, whose local copy may be gone
         """
         try:
             self.logger.info(f"Recording session {session_id} completed: success={success}")
@@ -199,36 +226,38 @@ class WorkflowCoordinator:
             with self._sessions_lock:
                 self.active_sessions.pop(session_id, None)
             
-            # Update session in database
-            session = self.session_repo.get_by_id(session_id)
-            if session:
-                from ..utils.timezone_utils import get_local_now
-                session.end_time = get_local_now()
-                
-                if success and output_file:
-                    session.status = RecordingStatus.COMPLETED
-                    session.output_file_path = output_file
-                    
-                    # Get file size
+            # Update session in database and load its transfer details in one round trip
+            from ..utils.timezone_utils import get_local_now
+            if success and output_file:
+                # An uploaded file may already be cleaned up; its size comes with the stage data
+                file_stat = None
+                if not transferred:
                     try:
-                        import os
-                        session.file_size_bytes = os.path.getsize(output_file)
-                    except Exception:
-                        pass
-                    
-                    # Queue for transfer
-                    self._queue_for_transfer(session_id, output_file)
-                    
-                else:
-                    session.status = RecordingStatus.FAILED
-                    if hasattr(session, 'error_message') and not session.error_message:
-                        session.error_message = "Recording failed without specific error"
+                        file_stat = os.stat(output_file)
+                        file_size = file_stat.st_size
+                    except FileNotFoundError:
+                        file_size = None
+                session = self.session_repo.complete_and_fetch_transfer_context(
+                    session_id,
+                    end_time=get_local_now(),
+                    status=RecordingStatus.COMPLETED,
+                    output_file=output_file,
+                    size=file_size
+                )
                 
-                self.session_repo.update(session)
+                # Queue for transfer
+                if session and not transferred:
+                    self._queue_for_transfer(session, output_file, file_stat)
+            else:
+                session = self.session_repo.complete_and_fetch_transfer_context(
+                    session_id,
+                    end_time=get_local_now(),
+                    status=RecordingStatus.FAILED,
+                    error_message="Recording failed without specific error"
+                )
             
             # Log completion
             if self.logging_service:
-                from .logging_service import OperationType, LogLevel
                 log_level = LogLevel.INFO if success else LogLevel.ERROR
                 self.logging_service.log_operation(
                     OperationType.RECORDING,
@@ -238,7 +267,7 @@ class WorkflowCoordinator:
                         'session_id': session_id,
                         'success': success,
                         'output_file': output_file,
-                        'file_size_bytes': session.file_size_bytes if session else None
+                        'file_size_bytes': file_size
                     }
                 )
             
@@ -255,9 +284,8 @@ class WorkflowCoordinator:
             progress: Progress percentage (0-100)
         """
         try:
-            # Log progress for monitoring
-            if self.logging_service:
-                from .logging_service import OperationType, LogLevel
+            # Log progress for monitoring; skip building the context when debug is off
+            if self.logging_service and self.logging_service.is_enabled_for(LogLevel.DEBUG, OperationType.RECORDING):
                 self.logging_service.log_operation(
                     OperationType.RECORDING,
                     f"Recording session {session_id} progress update: {message}",
@@ -272,40 +300,46 @@ class WorkflowCoordinator:
         except Exception as e:
             self.logger.error(f"Error handling progress update for session {session_id}: {e}")
     
-    def _queue_for_transfer(self, session_id: int, output_file: str):
+    def _queue_for_transfer(
+        self,
+        session: RecordingSession,
+        output_file: str,
+        file_stat: Optional[os.stat_result]
+    ):
         """
         Queue completed recording for file transfer.
         
         Args:
-            session_id: Session ID
+            session: Completed session with schedule.stream_config loaded
             output_file: Path to output file
+            file_stat: Result of the completion handler's os.stat, or None if
+                the file was missing
         """
+        session_id = session.id
         try:
-            # Get session and stream configuration for transfer details
-            session = self.session_repo.get_by_id(session_id)
-            if not session:
-                self.logger.error(f"Session {session_id} not found for transfer")
+            if file_stat is None:
+                self.logger.error(f"Output file {output_file} for session {session_id} not found for transfer")
                 return
             
-            # Get schedule to get stream configuration
-            from ..models.repositories import ScheduleRepository
-            schedule_repo = ScheduleRepository()
-            schedule = schedule_repo.get_by_id(session.schedule_id)
+            schedule = session.schedule
             if not schedule:
                 self.logger.error(f"Schedule {session.schedule_id} not found for transfer")
                 return
             
-            stream_config = self.config_repo.get_by_id(schedule.stream_config_id)
+            stream_config = schedule.stream_config
             if not stream_config:
                 self.logger.error(f"Stream config {schedule.stream_config_id} not found for transfer")
                 return
             
             # Queue for transfer
             self.transfer_queue.add_transfer(
-                session_id=session_id,
-                local_file_path=output_file,
-                remote_destination=stream_config.scp_destination,
-                stream_config=stream_config
+                local_path=output_file,
+                scp_destination=stream_config.scp_destination,
+                metadata={
+                    'session_id': session_id,
+                    'stream_config_id': stream_config.id,
+                    'file_size_bytes': file_stat.st_size
+                }
             )
             
             self.logger.info(f"Queued session {session_id} for transfer")
@@ -323,10 +357,9 @@ class WorkflowCoordinator:
         # This is called by scheduler when a session should be completed
         # (e.g., when duration is reached)
         try:
-            with self._sessions_lock:
-                recording_manager = self.active_sessions.get(session_id)
-                if recording_manager:
-                    recording_manager.stop_recording()
+            recording_manager = self.active_sessions.get(session_id)
+            if recording_manager:
+                recording_manager.stop_recording()
                     
         except Exception as e:
             self.logger.error(f"Error handling session completion for {session_id}: {e}")
@@ -340,22 +373,24 @@ class WorkflowCoordinator:
         """
         active_info = {}
         
-        with self._sessions_lock:
-            for session_id, manager in self.active_sessions.items():
-                try:
-                    active_info[session_id] = {
-                        'session_id': session_id,
-                        'status': manager.get_status(),
-                        'progress': manager.get_progress(),
-                        'start_time': manager.start_time if hasattr(manager, 'start_time') else None
-                    }
-                except Exception as e:
-                    self.logger.error(f"Error getting info for session {session_id}: {e}")
-                    active_info[session_id] = {
-                        'session_id': session_id,
-                        'status': 'error',
-                        'error': str(e)
-                    }
+        # Query the managers on a snapshot so sessions can finish meanwhile
+        sessions = self.active_sessions.copy()
+        
+        for session_id, manager in sessions.items():
+            try:
+                active_info[session_id] = {
+                    'session_id': session_id,
+                    'status': manager.get_status(),
+                    'progress': manager.get_progress(),
+                    'start_time': manager.start_time if hasattr(manager, 'start_time') else None
+                }
+            except Exception as e:
+                self.logger.error(f"Error getting info for session {session_id}: {e}")
+                active_info[session_id] = {
+                    'session_id': session_id,
+                    'status': 'error',
+                    'error': str(e)
+                }
         
         return active_info
     
@@ -370,14 +405,13 @@ class WorkflowCoordinator:
             True if stopped successfully, False otherwise
         """
         try:
-            with self._sessions_lock:
-                recording_manager = self.active_sessions.get(session_id)
-                if recording_manager:
-                    recording_manager.stop_recording()
-                    return True
-                else:
-                    self.logger.warning(f"Session {session_id} not found in active sessions")
-                    return False
+            recording_manager = self.active_sessions.get(session_id)
+            if recording_manager:
+                recording_manager.stop_recording()
+                return True
+            else:
+                self.logger.warning(f"Session {session_id} not found in active sessions")
+                return False
                     
         except Exception as e:
             self.logger.error(f"Error stopping session {session_id}: {e}")
@@ -386,8 +420,7 @@ class WorkflowCoordinator:
     def stop_all_sessions(self):
         """Stop all active recording sessions."""
         try:
-            with self._sessions_lock:
-                session_ids = list(self.active_sessions.keys())
+            session_ids = list(self.active_sessions.copy())
             
             for session_id in session_ids:
                 self.stop_session(session_id)
@@ -421,7 +454,6 @@ class WorkflowCoordinator:
                     
                     # Log backup creation
                     if self.logging_service:
-                        from .logging_service import OperationType, LogLevel
                         self.logging_service.log_operation(
                             OperationType.SYSTEM,
                             f"Automatic configuration backup created: {backup_result.get('backup_filename')}",
@@ -461,7 +493,6 @@ class WorkflowCoordinator:
             if backup_result.get('success'):
                 # Log backup creation
                 if self.logging_service:
-                    from .logging_service import OperationType, LogLevel
                     self.logging_service.log_operation(
                         OperationType.SYSTEM,
                         f"Manual configuration backup created: {backup_result.get('backup_filename')}",
@@ -507,7 +538,6 @@ class WorkflowCoordinator:
             if restore_result.get('success'):
                 # Log restore operation
                 if self.logging_service:
-                    from .logging_service import OperationType, LogLevel
                     self.logging_service.log_operation(
                         OperationType.SYSTEM,
                         f"Configuration restored from backup: {backup_filename}",
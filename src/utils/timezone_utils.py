@@ -2,16 +2,28 @@
 Timezone utilities for consistent local timezone handling.
 """
 
+import functools
 import os
-from datetime import datetime
+from datetime import datetime, tzinfo
 from typing import Optional
-import pytz
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+
+@functools.lru_cache(maxsize=4)
+def _resolve_timezone(tz_name: str) -> tzinfo:
+    """Look up a timezone once per name."""
+    try:
+        return ZoneInfo(tz_name)
+    except ZoneInfoNotFoundError:
+        # No system tz database (e.g. a minimal image); pytz bundles its own
+        import pytz
+        return pytz.timezone(tz_name)
 
 
 def get_local_timezone():
     """Get the local timezone from environment or default."""
-    tz_name = os.environ.get('TZ', 'US/Mountain')
-    return pytz.timezone(tz_name)
+    # TZ is still read on every call, so a changed TZ takes effect at once
+    return _resolve_timezone(os.environ.get('TZ', 'US/Mountain'))
 
 
 def get_local_now() -> datetime:
@@ -24,7 +36,11 @@ def localize_datetime(dt: datetime) -> datetime:
     """Convert naive datetime to local timezone."""
     if dt.tzinfo is None:
         local_tz = get_local_timezone()
-        return local_tz.localize(dt)
+        # pytz zones need localize() to pick the right offset; zoneinfo doesn't
+        localize = getattr(local_tz, 'localize', None)
+        if localize:
+            return localize(dt)
+        return dt.replace(tzinfo=local_tz)
     return dt
 
 
@@ -4,6 +4,7 @@ Tests StreamRecorder, AudioProcessor, and RecordingSessionManager with mocked de
 """
 
 import pytest
+import io
 import os
 import tempfile
 import subprocess
@@ -12,21 +13,34 @@ import time
 from unittest.mock import Mock, patch, MagicMock, call, mock_open
 from datetime import datetime, date, timedelta
 from pathlib import Path
+from urllib.parse import urlparse
 
 import requests
 from mutagen.mp3 import MP3
 from mutagen.id3 import ID3, TIT2, TPE1, TALB, TPE2, TRCK, TDRC, APIC
 from PIL import Image
 
-from src.services.stream_recorder import StreamRecorder, RecordingStatus
+from src.services.stream_recorder import (
+    StreamRecorder, RecordingStatus, _validation_cache, resolve_executable,
+    _get_status_callback_executor
+)
 from src.services.audio_processor import AudioProcessor
-from src.services.recording_session_manager import RecordingSessionManager, WorkflowStage
+from src.services.recording_session_manager import (
+    RecordingSessionManager, WorkflowStage, _coalesced_progress
+)
 from src.models.stream_configuration import StreamConfiguration
 
 
 class TestStreamRecorder:
     """Test StreamRecorder class with mocked FFmpeg operations."""
     
+    @pytest.fixture(autouse=True)
+    def clear_validation_cache(self):
+        """Don't let stream checks cached by one test satisfy another."""
+        _validation_cache.clear()
+        yield
+        _validation_cache.clear()
+    
     @pytest.fixture
     def temp_output_path(self):
         """Create temporary output path for testing."""
@@ -46,6 +60,17 @@ class TestStreamRecorder:
             duration_minutes=5
         )
     
+    def test_output_dir_created_once(self, tmp_path):
+        """Test recorders writing to the same folder create it only once."""
+        output_dir = tmp_path / "shows"
+        
+        with patch('src.services.stream_recorder.os.makedirs', wraps=os.makedirs) as mock_makedirs:
+            StreamRecorder("https://example.com/stream.mp3", str(output_dir / "a.mp3"))
+            StreamRecorder("https://example.com/stream.mp3", str(output_dir / "b.mp3"))
+        
+        mock_makedirs.assert_called_once_with(str(output_dir), exist_ok=True)
+        assert output_dir.is_dir()
+    
     def test_init(self, recorder, temp_output_path):
         """Test StreamRecorder initialization."""
         assert recorder.stream_url == "https://example.com/stream.mp3"
@@ -59,7 +84,8 @@ class TestStreamRecorder:
     
     def test_validate_stream_url_http_success(self, recorder):
         """Test successful HTTP stream URL validation."""
-        with patch('requests.head') as mock_head:
+        with patch('src.services.stream_recorder._get_http_session') as mock_get_session:
+            mock_head = mock_get_session.return_value.head
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.headers = {'content-type': 'audio/mpeg'}
@@ -70,14 +96,66 @@ class TestStreamRecorder:
             assert result is True
             mock_head.assert_called_once_with(
                 recorder.stream_url,
-                timeout=10,
-                allow_redirects=True,
-                headers={'User-Agent': 'AudioStreamRecorder/1.0'}
+                timeout=(3, 7),
+                allow_redirects=True
             )
     
+    def test_http_session_shared(self):
+        """Test stream checks share one pooled session."""
+        from src.services.stream_recorder import _get_http_session
+        
+        session = _get_http_session()
+        
+        assert _get_http_session() is session
+        assert session.headers['User-Agent'] == 'AudioStreamRecorder/1.0'
+        assert session.get_adapter('https://example.com').max_retries.total == 2
+    
+    def test_test_stream_connections_batch(self):
+        """Test a batch of URLs is checked concurrently with results kept in order."""
+        urls = [
+            "https://example.com/a.mp3",
+            "https://example.com/missing.mp3",
+            "ftp://example.com/c.mp3",
+        ]
+        
+        def head(url, **kwargs):
+            response = MagicMock(headers={'content-type': 'audio/mpeg'})
+            response.status_code = 404 if 'missing' in url else 200
+            return response
+        
+        with patch('src.services.stream_recorder._get_http_session') as mock_get_session:
+            mock_get_session.return_value.head.side_effect = head
+            results = StreamRecorder.test_stream_connections(urls)
+        
+        assert [r['success'] for r in results] == [True, False, False]
+        assert "HTTP error: 404" in results[1]['message']
+        assert "Unsupported protocol: ftp" in results[2]['message']
+        assert mock_get_session.return_value.head.call_count == 2
+        assert StreamRecorder.test_stream_connections([]) == []
+    
+    def test_validate_stream_url_http_cached(self, recorder):
+        """Test a recent successful check is reused until recording fails."""
+        with patch('src.services.stream_recorder._get_http_session') as mock_get_session:
+            mock_head = mock_get_session.return_value.head
+            mock_head.return_value.status_code = 200
+            mock_head.return_value.headers = {'content-type': 'audio/mpeg'}
+            
+            assert recorder.validate_stream_url() is True
+            assert recorder.validate_stream_url() is True
+            assert mock_head.call_count == 1
+            
+            recorder.process = Mock()
+            recorder.process.poll.return_value = 1
+            recorder.process.returncode = 1
+            recorder._monitor_recording()
+            
+            assert recorder.validate_stream_url() is True
+            assert mock_head.call_count == 2
+    
     def test_validate_stream_url_http_failure(self, recorder):
         """Test HTTP stream URL validation failure."""
-        with patch('requests.head') as mock_head:
+        with patch('src.services.stream_recorder._get_http_session') as mock_get_session:
+            mock_head = mock_get_session.return_value.head
             mock_response = Mock()
             mock_response.status_code = 404
             mock_head.return_value = mock_response
@@ -89,7 +167,8 @@ class TestStreamRecorder:
     
     def test_validate_stream_url_connection_error(self, recorder):
         """Test HTTP stream URL validation with connection error."""
-        with patch('requests.head') as mock_head:
+        with patch('src.services.stream_recorder._get_http_session') as mock_get_session:
+            mock_head = mock_get_session.return_value.head
             mock_head.side_effect = requests.exceptions.ConnectionError("Connection failed")
             
             result = recorder.validate_stream_url()
@@ -119,6 +198,7 @@ class TestStreamRecorder:
         with patch('subprocess.run') as mock_run:
             mock_result = Mock()
             mock_result.returncode = 0
+            mock_result.stdout = b"video\naudio\n"
             mock_run.return_value = mock_result
             
             result = recorder.validate_stream_url()
@@ -126,9 +206,60 @@ class TestStreamRecorder:
             assert result is True
             mock_run.assert_called_once()
             args = mock_run.call_args[0][0]
-            assert 'ffprobe' in args
+            assert args[0] == resolve_executable('ffprobe')
             assert recorder.stream_url in args
     
+    def test_validate_stream_url_rtmp_no_audio(self, temp_output_path):
+        """Test an RTMP stream without an audio track is rejected."""
+        recorder = StreamRecorder(
+            stream_url="rtmp://example.com/live/stream",
+            output_path=temp_output_path
+        )
+        
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value.returncode = 0
+            mock_run.return_value.stdout = b"video\n"
+            
+            assert recorder.validate_stream_url() is False
+            assert "no audio stream" in recorder.error_message
+    
+    def test_validate_stream_url_shared_between_recorders(self, temp_output_path):
+        """Test a stream tested from the UI is not probed again when recording starts."""
+        tester = StreamRecorder("https://example.com/other.mp3", temp_output_path)
+        recorder = StreamRecorder("rtmp://example.com/live/shared", temp_output_path)
+        
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value.returncode = 0
+            mock_run.return_value.stdout = b"audio\n"
+            
+            assert tester.test_stream_connection("rtmp://example.com/live/shared")['success'] is True
+            assert recorder.validate_stream_url() is True
+        
+        mock_run.assert_called_once()
+    
+    def test_url_scheme_parsed_once(self, recorder):
+        """Test the URL scheme is parsed once and re-parsed when the URL changes."""
+        with patch('src.services.stream_recorder.urlparse', wraps=urlparse) as mock_urlparse:
+            assert recorder._get_url_scheme() == 'https'
+            assert recorder._get_url_scheme() == 'https'
+            recorder.stream_url = "rtmp://example.com/live/stream"
+            assert recorder._get_url_scheme() == 'rtmp'
+        
+        assert mock_urlparse.call_count == 2
+    
+    def test_test_stream_connection_leaves_recorder_untouched(self, recorder):
+        """Test testing another URL leaves the recorder's own URL and error alone."""
+        recorder._get_url_scheme()
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(returncode=1, stderr=b"Connection failed")
+            result = recorder.test_stream_connection("rtmp://example.com/live/other")
+        
+        assert result['success'] is False
+        assert "RTMP stream test failed" in result['message']
+        assert recorder.stream_url == "https://example.com/stream.mp3"
+        assert recorder._url_scheme == 'https'
+        assert recorder.error_message is None
+    
     def test_validate_stream_url_rtmp_failure(self, temp_output_path):
         """Test RTMP stream URL validation failure."""
         recorder = StreamRecorder(
@@ -139,13 +270,14 @@ class TestStreamRecorder:
         with patch('subprocess.run') as mock_run:
             mock_result = Mock()
             mock_result.returncode = 1
-            mock_result.stderr = "Connection failed"
+            mock_result.stderr = b"Connection failed"
             mock_run.return_value = mock_result
             
             result = recorder.validate_stream_url()
             
             assert result is False
             assert "RTMP stream test failed" in recorder.error_message
+            assert "Connection failed" in recorder.error_message
     
     @patch('src.services.stream_recorder.subprocess.Popen')
     @patch('src.services.stream_recorder.os.makedirs')
@@ -191,10 +323,19 @@ class TestStreamRecorder:
             cmd = recorder._build_ffmpeg_command()
             
             expected_cmd = [
-                'ffmpeg',
+                resolve_executable('ffmpeg'),
                 '-y',
+                '-loglevel', 'error',
+                '-fflags', '+nobuffer',
+                '-probesize', '32768',
+                '-analyzeduration', '0',
+                '-rw_timeout', '15000000',
+                '-reconnect', '1',
+                '-reconnect_streamed', '1',
+                '-reconnect_delay_max', '5',
                 '-i', recorder.stream_url,
-                '-c', 'copy',
+                '-acodec', 'libmp3lame',
+                '-ab', '128k',
                 '-f', 'mp3',
                 '-t', '300',  # 5 minutes * 60 seconds
                 recorder.output_path
@@ -212,16 +353,37 @@ class TestStreamRecorder:
         with patch('src.config.config.FFMPEG_PATH', 'ffmpeg'):
             cmd = recorder._build_ffmpeg_command()
             
-            expected_cmd = [
-                'ffmpeg',
-                '-y',
+            assert cmd[-7:] == [
                 '-i', recorder.stream_url,
-                '-c', 'copy',
+                '-acodec', 'libmp3lame',
+                '-ab', '128k',
                 '-f', 'mp3',
                 recorder.output_path
             ]
-            
-            assert cmd == expected_cmd
+            assert '-t' not in cmd
+    
+    def test_resolve_executable_cached(self):
+        """Test executables are looked up on PATH once and fall back to the name."""
+        resolve_executable.cache_clear()
+        with patch('src.services.stream_recorder.shutil.which', side_effect=[None, '/usr/bin/ffprobe']) as mock_which:
+            assert resolve_executable('missing-tool') == 'missing-tool'
+            assert resolve_executable('ffprobe') == '/usr/bin/ffprobe'
+            assert resolve_executable('ffprobe') == '/usr/bin/ffprobe'
+        
+        assert mock_which.call_count == 2
+        resolve_executable.cache_clear()
+    
+    def test_build_ffmpeg_command_rtmp_no_reconnect(self, temp_output_path):
+        """Test HTTP-only reconnect options are left out for RTMP streams."""
+        recorder = StreamRecorder(
+            stream_url="rtmp://example.com/live/stream",
+            output_path=temp_output_path
+        )
+        
+        cmd = recorder._build_ffmpeg_command()
+        
+        assert '-reconnect' not in cmd
+        assert cmd.index('-probesize') < cmd.index('-i')
     
     @patch('src.services.stream_recorder.os.killpg')
     @patch('src.services.stream_recorder.os.getpgid')
@@ -240,11 +402,98 @@ class TestStreamRecorder:
         mock_killpg.assert_called()
         mock_process.wait.assert_called_with(timeout=5)
     
+    @patch('src.services.stream_recorder.time.monotonic')
+    def test_monitor_recording_duration_limit(self, mock_monotonic, recorder):
+        """Test the duration limit is enforced on the monotonic clock."""
+        recorder.process = Mock()
+        recorder.process.poll.return_value = None
+        recorder.process.returncode = 0
+        recorder.process.stderr = None
+        
+        # Deadline computed at 1000s; second check is past the 5 minute limit
+        mock_monotonic.side_effect = [1000.0, 1000.0, 1000.0 + 5 * 60]
+        
+        with patch.object(recorder, '_terminate_process') as mock_terminate, \
+             patch.object(recorder, '_wait_for_wake') as mock_wait:
+            recorder._monitor_recording()
+        
+        mock_terminate.assert_called_once()
+        mock_wait.assert_called_once_with(30)
+    
+    @patch('src.services.stream_recorder.time.monotonic')
+    def test_monitor_recording_wakes_at_deadline(self, mock_monotonic, recorder):
+        """Test the last wait before the duration limit is shortened to end on time."""
+        recorder.process = Mock()
+        recorder.process.poll.return_value = None
+        recorder.process.returncode = 0
+        
+        # 0.25s left on the second check, past the limit on the third
+        mock_monotonic.side_effect = [1000.0, 1000.0, 1300.0 - 0.25, 1300.0]
+        
+        with patch.object(recorder, '_terminate_process') as mock_terminate, \
+             patch.object(recorder, '_wait_for_wake') as mock_wait:
+            recorder._monitor_recording()
+        
+        assert mock_wait.call_args_list == [call(30), call(0.25)]
+        mock_terminate.assert_called_once()
+    
+    def test_monitor_recording_tracks_output_size(self, recorder):
+        """Test the output size is read through one descriptor and closed at the end."""
+        with open(recorder.output_path, 'wb') as f:
+            f.write(b"x" * 2048)
+        recorder.process = Mock()
+        recorder.process.poll.side_effect = [None, 0]
+        recorder.process.returncode = 0
+        
+        with patch('src.services.stream_recorder.os.open', wraps=os.open) as mock_open_fd, \
+             patch('src.services.stream_recorder.os.close', wraps=os.close) as mock_close, \
+             patch.object(recorder, '_wait_for_wake'):
+            recorder._monitor_recording()
+        
+        assert recorder.bytes_recorded == 2048
+        mock_open_fd.assert_called_once()
+        mock_close.assert_called_once()
+    
+    def test_stop_wakes_monitor(self, recorder):
+        """Test stop_recording() wakes a monitor that is waiting without a deadline."""
+        recorder.duration_minutes = None
+        recorder.process = Mock()
+        recorder.process.poll.return_value = None
+        recorder.process.returncode = 0
+        
+        with patch.object(recorder, '_terminate_process') as mock_terminate:
+            monitor = threading.Thread(target=recorder._monitor_recording)
+            monitor.start()
+            time.sleep(0.1)
+            recorder.status = RecordingStatus.RECORDING
+            assert recorder.stop_recording() is True
+            monitor.join(timeout=2)
+        
+        assert not monitor.is_alive()
+        mock_terminate.assert_called_once()
+        assert recorder._wake_r is None
+    
+    def test_stderr_drained_into_bounded_tail(self, recorder):
+        """Test FFmpeg stderr is read continuously and only the tail is kept."""
+        recorder._drain_stderr(io.BytesIO(b"".join(b"line %d\n" % i for i in range(500))))
+        
+        assert len(recorder._stderr_tail) == 200
+        assert recorder._stderr_tail[-1] == "line 499\n"
+        
+        recorder.process = Mock()
+        recorder.process.poll.return_value = 1
+        recorder.process.returncode = 1
+        recorder._monitor_recording()
+        
+        assert recorder.status == RecordingStatus.FAILED
+        assert "line 499" in recorder.error_message
+        assert "line 299\n" not in recorder.error_message
+    
     def test_stop_recording_success(self, recorder):
         """Test successful recording stop."""
         recorder.status = RecordingStatus.RECORDING
-        recorder.recording_thread = Mock()
-        recorder.recording_thread.is_alive.return_value = False
+        recorder.recording_future = Mock()
+        recorder.recording_future.done.return_value = True
         
         result = recorder.stop_recording()
         
@@ -281,6 +530,7 @@ class TestStreamRecorder:
         recorder.set_status_callback(callback_mock)
         
         recorder._update_status(RecordingStatus.RECORDING, {'test': 'data'})
+        _get_status_callback_executor().submit(lambda: None).result()
         
         callback_mock.assert_called_once()
         args = callback_mock.call_args
@@ -288,6 +538,29 @@ class TestStreamRecorder:
         assert 'test' in args[0][1]
         assert args[0][1]['test'] == 'data'
     
+    def test_status_callback_runs_off_thread(self, recorder):
+        """Test a slow status callback doesn't block the recorder and sees snapshots in order."""
+        release = threading.Event()
+        payloads = []
+        
+        def callback(status, data):
+            release.wait(timeout=5)
+            payloads.append((threading.current_thread().name, data['status'], data['bytes_recorded']))
+        
+        recorder.set_status_callback(callback)
+        recorder._update_status(RecordingStatus.RECORDING)
+        recorder.bytes_recorded = 2048
+        recorder._update_status(RecordingStatus.STOPPING)
+        
+        assert recorder.status == RecordingStatus.STOPPING
+        assert payloads == []
+        
+        release.set()
+        _get_status_callback_executor().submit(lambda: None).result()
+        
+        assert [(status, size) for _, status, size in payloads] == [('recording', 0), ('stopping', 2048)]
+        assert all(name.startswith('recording-status') for name, _, _ in payloads)
+    
     def test_context_manager(self, temp_output_path):
         """Test context manager functionality."""
         with StreamRecorder("https://example.com/stream.mp3", temp_output_path) as recorder:
@@ -376,6 +649,21 @@ class TestAudioProcessor:
         assert result is True
         mock_copy.assert_called_once_with(input_path, output_path)
     
+    @patch('src.services.audio_processor.shutil.copy2')
+    @patch('src.services.audio_processor.shutil.move')
+    @patch('src.services.audio_processor.os.path.exists')
+    def test_convert_to_mp3_already_mp3_move_input(self, mock_exists, mock_move, mock_copy, processor):
+        """Test MP3 input is renamed into place when it is disposable."""
+        input_path = "/path/to/input.mp3"
+        output_path = "/path/to/output.mp3"
+        mock_exists.return_value = True
+        
+        result = processor._convert_to_mp3(input_path, output_path, move_input=True)
+        
+        assert result is True
+        mock_move.assert_called_once_with(input_path, output_path)
+        mock_copy.assert_not_called()
+    
     @patch('src.services.audio_processor.subprocess.run')
     @patch('src.services.audio_processor.os.path.exists')
     def test_convert_to_mp3_ffmpeg_failure(self, mock_exists, mock_run, processor, temp_files):
@@ -763,7 +1051,7 @@ class TestAudioProcessor:
                 
                 assert result is True
                 mock_makedirs.assert_called_once()
-                mock_convert.assert_called_once_with(input_path, output_path)
+                mock_convert.assert_called_once_with(input_path, output_path, move_input=False)
                 mock_embed.assert_called_once()
     
     def test_process_audio_file_conversion_failure(self, processor, sample_metadata):
@@ -924,6 +1212,7 @@ class TestRecordingSessionManager:
             
             assert result is True
             session_manager.audio_processor.process_audio_file.assert_called_once()
+            assert session_manager.audio_processor.process_audio_file.call_args[1]['move_input'] is True
     
     def test_execute_processing_stage_failure(self, session_manager):
         """Test processing stage with failure."""
@@ -945,6 +1234,22 @@ class TestRecordingSessionManager:
         
         assert result is True  # Placeholder always succeeds
     
+    def test_failed_transfer_still_completes(self, session_manager):
+        """Test a failed upload completes the workflow and leaves the file for the transfer queue."""
+        stages = []
+        session_manager.set_status_callback(lambda stage, data: stages.append((stage, data)))
+        
+        with patch.object(session_manager, '_execute_recording_stage', return_value=True), \
+             patch.object(session_manager, '_execute_processing_stage', return_value=True), \
+             patch.object(session_manager, '_execute_transfer_stage', return_value=False), \
+             patch.object(session_manager, '_cleanup_temporary_files'):
+            session_manager._run_workflow()
+        
+        stage, data = stages[-1]
+        assert stage == WorkflowStage.COMPLETED
+        assert data['transferred'] is False
+        assert data['file_size_bytes'] is None
+    
     def test_stop_recording_success(self, session_manager):
         """Test successful recording stop."""
         session_manager.current_stage = WorkflowStage.RECORDING
@@ -1001,43 +1306,52 @@ class TestRecordingSessionManager:
         assert result is False
         assert "Cannot retry" in session_manager.error_message
     
-    @patch('src.services.recording_session_manager.os.path.exists')
-    @patch('src.services.recording_session_manager.os.remove')
-    def test_cleanup_failed_attempt(self, mock_remove, mock_exists, session_manager):
+    def test_cleanup_failed_attempt(self, session_manager, tmp_path):
         """Test cleanup of failed attempt files."""
-        session_manager.raw_recording_path = "/path/to/raw.mp3"
-        session_manager.processed_mp3_path = "/path/to/processed.mp3"
-        mock_exists.return_value = True
+        raw_path = tmp_path / "raw.mp3"
+        processed_path = tmp_path / "processed.mp3"
+        raw_path.write_bytes(b"raw")
+        processed_path.write_bytes(b"processed")
+        session_manager.raw_recording_path = str(raw_path)
+        session_manager.processed_mp3_path = str(processed_path)
         
         session_manager._cleanup_failed_attempt()
         
-        assert mock_remove.call_count == 2
-        mock_remove.assert_any_call("/path/to/raw.mp3")
-        mock_remove.assert_any_call("/path/to/processed.mp3")
+        assert not raw_path.exists()
+        assert not processed_path.exists()
     
-    @patch('src.services.recording_session_manager.os.path.exists')
-    @patch('src.services.recording_session_manager.os.remove')
-    def test_cleanup_temporary_files(self, mock_remove, mock_exists, session_manager):
+    def test_cleanup_failed_attempt_missing_files(self, session_manager, tmp_path):
+        """Test cleanup of failed attempt tolerates files that were never written."""
+        session_manager.raw_recording_path = str(tmp_path / "raw.mp3")
+        session_manager.processed_mp3_path = None
+        
+        session_manager._cleanup_failed_attempt()
+        
+        assert not (tmp_path / "raw.mp3").exists()
+    
+    def test_cleanup_temporary_files(self, session_manager, tmp_path):
         """Test cleanup of temporary files."""
-        session_manager.raw_recording_path = "/path/to/raw.mp3"
-        session_manager.processed_mp3_path = "/path/to/processed.mp3"
-        mock_exists.return_value = True
+        raw_path = tmp_path / "raw.mp3"
+        processed_path = tmp_path / "processed.mp3"
+        raw_path.write_bytes(b"raw")
+        processed_path.write_bytes(b"processed")
+        session_manager.raw_recording_path = str(raw_path)
+        session_manager.processed_mp3_path = str(processed_path)
         
         session_manager._cleanup_temporary_files()
         
         # Should only remove raw file, not processed file
-        mock_remove.assert_called_once_with("/path/to/raw.mp3")
+        assert not raw_path.exists()
+        assert processed_path.exists()
     
     @patch('src.services.recording_session_manager.os.path.getsize')
-    @patch('src.services.recording_session_manager.os.path.exists')
-    def test_get_session_info(self, mock_exists, mock_getsize, session_manager):
+    def test_get_session_info(self, mock_getsize, session_manager):
         """Test getting session information."""
         session_manager.start_time = datetime(2023, 1, 1, 12, 0, 0)
         session_manager.end_time = datetime(2023, 1, 1, 12, 30, 0)
         session_manager.raw_recording_path = "/path/to/raw.mp3"
         session_manager.processed_mp3_path = "/path/to/processed.mp3"
         
-        mock_exists.return_value = True
         mock_getsize.side_effect = [1024000, 2048000]  # Raw and processed file sizes
         
         info = session_manager.get_session_info()
@@ -1047,9 +1361,23 @@ class TestRecordingSessionManager:
         assert info['stream_name'] == "Test Stream"
         assert info['duration_minutes'] == 30
         assert info['duration_seconds'] == 1800  # 30 minutes
+        assert info['start_time'] == "2023-01-01T12:00:00"
         assert info['raw_file_size_bytes'] == 1024000
         assert info['processed_file_size_bytes'] == 2048000
     
+    @patch('src.services.recording_session_manager.os.path.getsize')
+    def test_get_session_info_missing_files(self, mock_getsize, session_manager):
+        """Test session information when recording files are not on disk."""
+        session_manager.raw_recording_path = "/path/to/raw.mp3"
+        session_manager.processed_mp3_path = "/path/to/processed.mp3"
+        mock_getsize.side_effect = FileNotFoundError
+        
+        info = session_manager.get_session_info()
+        
+        assert info['raw_file_size_bytes'] == 0
+        assert info['processed_file_size_bytes'] == 0
+        assert info['duration_seconds'] is None
+    
     def test_status_callback(self, session_manager):
         """Test status callback functionality."""
         callback_mock = Mock()
@@ -1072,6 +1400,23 @@ class TestRecordingSessionManager:
         
         callback_mock.assert_called_once_with("Test operation", 50.0)
     
+    def test_coalesced_progress(self):
+        """Test per-chunk transfer progress is coalesced before forwarding."""
+        forwarded = []
+        progress = _coalesced_progress(forwarded.append, min_delta=1.0, min_interval=60)
+        
+        for transferred in range(0, 1001):
+            progress(transferred, 1000)
+        
+        # At most one update per percent, always including the final completion
+        assert 90 <= len(forwarded) <= 101
+        assert forwarded[0] == 0.0
+        assert forwarded[-1] == 100.0
+        
+        count = len(forwarded)
+        progress(10, 0)
+        assert len(forwarded) == count
+    
     def test_context_manager(self, stream_config):
         """Test context manager functionality."""
         with patch('src.services.recording_session_manager.os.makedirs'):
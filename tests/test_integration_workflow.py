@@ -17,6 +17,7 @@ from src.config import config
 from src.services.workflow_coordinator import WorkflowCoordinator
 from src.services.scheduler_service import SchedulerService
 from src.services.transfer_queue import TransferQueue
+from src.services.recording_session_manager import WorkflowStage
 from src.models.stream_configuration import StreamConfiguration
 from src.models.recording_schedule import RecordingSchedule
 from src.models.recording_session import RecordingSession, RecordingStatus
@@ -237,7 +238,7 @@ class TestWorkflowIntegration:
             assert len(active_sessions) == 2
             
             # Try to start third recording - should be limited by scheduler
-            # This would be handled by scheduler's _can_start_recording method
+            # This would be handled by scheduler's _try_acquire_slot method
     
     def test_error_handling_in_workflow(self, service_container, sample_schedule):
         """Test error handling throughout the workflow."""
@@ -299,6 +300,45 @@ class TestWorkflowIntegration:
             if os.path.exists(test_file):
                 os.remove(test_file)
     
+    def test_completed_stage_dispatch(self, service_container):
+        """Test the session manager's completed stage reaches the completion handler."""
+        workflow_coordinator = service_container.get_service('workflow_coordinator')
+        
+        with patch.object(workflow_coordinator, '_handle_recording_completion') as mock_completion:
+            workflow_coordinator._handle_recording_status_change(
+                1, WorkflowStage.COMPLETED,
+                {'processed_mp3_path': "/test/output.mp3", 'transferred': True, 'file_size_bytes': 1024}
+            )
+            workflow_coordinator._handle_recording_status_change(
+                2, WorkflowStage.FAILED, {'processed_mp3_path': "/test/output.mp3"}
+            )
+        
+        assert mock_completion.call_args_list == [
+            ((1, True, "/test/output.mp3"), {'transferred': True, 'file_size': 1024}),
+            ((2, False, None), {})
+        ]
+    
+    def test_transferred_recording_not_queued_again(self, service_container, sample_schedule):
+        """Test a file the session manager already uploaded and cleaned up is not queued again."""
+        workflow_coordinator = service_container.get_service('workflow_coordinator')
+        transfer_queue = service_container.get_service('transfer_queue')
+        transfer_queue.add_transfer = Mock()
+        
+        # The local copy was removed after the upload
+        test_file = os.path.join(config.RECORDINGS_DIR, "test_output.mp3")
+        
+        with patch.object(workflow_coordinator.session_repo, 'complete_and_fetch_transfer_context') as mock_complete:
+            workflow_coordinator._handle_recording_completion(
+                session_id=1,
+                success=True,
+                output_file=test_file,
+                transferred=True,
+                file_size=1024
+            )
+        
+        assert mock_complete.call_args[1]['size'] == 1024
+        transfer_queue.add_transfer.assert_not_called()
+    
     def test_session_stop_functionality(self, service_container, sample_schedule):
         """Test stopping active recording sessions."""
         workflow_coordinator = service_container.get_service('workflow_coordinator')
@@ -102,6 +102,27 @@ class TestSchedulerService:
         for expr in invalid_expressions:
             assert not scheduler_service.validate_cron_expression(expr), f"Should be invalid: {expr}"
     
+    def test_validate_cron_expression_rejects_garbage(self, scheduler_service):
+        """Test oversized and malformed input is rejected before parsing."""
+        with patch('src.services.scheduler_service._cron_validation_error') as mock_validate:
+            assert not scheduler_service.validate_cron_expression("0 " * 200 + "* * * *")
+            assert not scheduler_service.validate_cron_expression("0 1 * * *; rm -rf /")
+            mock_validate.assert_not_called()
+    
+    def test_validate_cron_expression_cached(self, scheduler_service):
+        """Test repeated validation reuses the parsed trigger."""
+        from src.services.scheduler_service import _cron_trigger_cached
+        from src.utils.timezone_utils import get_local_timezone
+        
+        assert scheduler_service.validate_cron_expression("5 4 * * *")
+        trigger = _cron_trigger_cached("5 4 * * *", get_local_timezone())
+        
+        with patch('src.services.scheduler_service.croniter') as mock_croniter:
+            assert scheduler_service.validate_cron_expression(" 5 4 * * * ")
+            mock_croniter.assert_not_called()
+        
+        assert _cron_trigger_cached("5 4 * * *", get_local_timezone()) is trigger
+    
     def test_calculate_next_run_time(self, scheduler_service):
         """Test next run time calculation."""
         # Test daily at 1 AM
@@ -117,18 +138,49 @@ class TestSchedulerService:
         next_time = scheduler_service.calculate_next_run_time("invalid")
         assert next_time is None
     
+    def test_calculate_next_run_time_fixed_interval(self, scheduler_service):
+        """Test fixed-interval fast path matches croniter."""
+        from croniter import croniter
+        
+        base_times = [
+            datetime(2024, 1, 1, 0, 0, 0),
+            datetime(2024, 1, 1, 10, 7, 30),
+            datetime(2024, 1, 1, 23, 59, 59),
+        ]
+        for expr in ["* * * * *", "*/15 * * * *", "0 * * * *"]:
+            for base_time in base_times:
+                expected = croniter(expr, base_time).get_next(datetime)
+                next_time = scheduler_service.calculate_next_run_time(expr, base_time)
+                assert next_time.replace(tzinfo=None) == expected, f"{expr} from {base_time}"
+    
     def test_add_schedule(self, scheduler_service, sample_schedule):
         """Test adding a schedule."""
         scheduler_service.start()
         
         # Test adding valid schedule
         assert scheduler_service.add_schedule(sample_schedule)
+        assert sample_schedule.next_run_time is not None
         
         # Verify job was scheduled
         jobs = scheduler_service.get_scheduled_jobs()
         assert len(jobs) == 1
         assert jobs[0]['id'] == f"recording_schedule_{sample_schedule.id}"
     
+    def test_schedule_job_uses_loaded_stream_config(self, scheduler_service, sample_schedule,
+                                                     sample_stream_config_data):
+        """Test job naming reuses an already loaded stream configuration."""
+        scheduler_service.start()
+        sample_schedule.stream_config = StreamConfiguration(
+            **dict(sample_stream_config_data, name="Loaded Stream")
+        )
+        
+        with patch.object(scheduler_service.config_repo, 'get_by_id') as mock_get:
+            assert scheduler_service._schedule_recording_job(sample_schedule)
+            mock_get.assert_not_called()
+        
+        jobs = scheduler_service.get_scheduled_jobs()
+        assert jobs[0]['name'] == "Recording: Loaded Stream"
+    
     def test_update_schedule(self, scheduler_service, sample_schedule):
         """Test updating a schedule."""
         scheduler_service.start()
@@ -147,6 +199,26 @@ class TestSchedulerService:
         assert len(jobs) == 1
         # Note: Detailed trigger verification would require APScheduler internals
     
+    def test_job_executors(self, scheduler_service, sample_schedule):
+        """Test that housekeeping and recording jobs use separate executors."""
+        scheduler_service.start()
+        scheduler_service.add_schedule(sample_schedule)
+        
+        refresh_job = scheduler_service.scheduler.get_job("schedule_window_refresh")
+        recording_job = scheduler_service.scheduler.get_job(f"recording_schedule_{sample_schedule.id}")
+        assert refresh_job.executor == 'maintenance'
+        assert recording_job.executor == 'default'
+    
+    def test_job_consistency_check(self, scheduler_service, sample_schedule):
+        """Test comparing live jobs with registered schedules."""
+        scheduler_service.start()
+        scheduler_service.add_schedule(sample_schedule)
+        assert scheduler_service._check_job_consistency()
+        
+        # Job removed behind the service's back
+        scheduler_service.scheduler.remove_job(f"recording_schedule_{sample_schedule.id}")
+        assert not scheduler_service._check_job_consistency()
+    
     def test_remove_schedule(self, scheduler_service, sample_schedule):
         """Test removing a schedule."""
         scheduler_service.start()
@@ -159,29 +231,100 @@ class TestSchedulerService:
         assert scheduler_service.remove_schedule(sample_schedule.id)
         assert len(scheduler_service.get_scheduled_jobs()) == 0
     
+    def test_refresh_schedule_window(self, scheduler_service, sample_schedule):
+        """Test the lookahead window registers due schedules and drops inactive ones."""
+        scheduler_service.start()
+        
+        with patch.object(scheduler_service.schedule_repo, 'get_active_schedule_ids',
+                          return_value=[sample_schedule.id]), \
+             patch.object(scheduler_service.schedule_repo, 'get_due_within',
+                          return_value=[sample_schedule]):
+            scheduler_service.refresh_schedules()
+        
+        jobs = scheduler_service.get_scheduled_jobs()
+        assert [job['id'] for job in jobs] == [f"recording_schedule_{sample_schedule.id}"]
+        
+        with patch.object(scheduler_service.schedule_repo, 'get_active_schedule_ids', return_value=[]), \
+             patch.object(scheduler_service.schedule_repo, 'get_due_within', return_value=[]):
+            scheduler_service.refresh_schedules()
+        
+        assert scheduler_service.get_scheduled_jobs() == []
+    
     def test_concurrent_recording_limits(self, scheduler_service):
         """Test concurrent recording session limits."""
-        # Mock active sessions at limit
-        mock_sessions = {}
+        # Sessions at limit
         for i in range(config.MAX_CONCURRENT_RECORDINGS):
-            mock_session = Mock()
-            mock_session.current_stage.value = 'recording'
-            mock_sessions[i] = mock_session
-        
-        scheduler_service.active_sessions = mock_sessions
+            assert scheduler_service._try_acquire_slot()
+            scheduler_service._slot_holders.add(i)
         
         # Should not be able to start new recording
-        assert not scheduler_service._can_start_recording()
+        assert not scheduler_service._try_acquire_slot()
+        
+        # One session finishes, reported twice
+        scheduler_service.release_recording_slot(0)
+        scheduler_service.release_recording_slot(0)
+        
+        # Exactly one slot is free again
+        assert scheduler_service._try_acquire_slot()
+        assert not scheduler_service._try_acquire_slot()
+    
+    def test_tracked_session_cap(self, scheduler_service):
+        """Test that too many tracked sessions block new recordings."""
+        for i in range(2 * config.MAX_CONCURRENT_RECORDINGS):
+            scheduler_service.active_sessions[i] = Mock()
+        
+        # No slot is held, but the tracked session cap is reached
+        assert not scheduler_service._try_acquire_slot()
+        
+        scheduler_service.active_sessions.pop(0)
+        assert scheduler_service._try_acquire_slot()
+    
+    def test_remove_completed_session_frees_tracking(self, scheduler_service):
+        """Test finished sessions stop counting towards the tracked session cap."""
+        for i in range(2 * config.MAX_CONCURRENT_RECORDINGS):
+            scheduler_service.active_sessions[i] = Mock()
+        assert not scheduler_service._try_acquire_slot()
         
-        # Remove one session
-        del mock_sessions[0]
-        scheduler_service.active_sessions = mock_sessions
+        for i in range(2 * config.MAX_CONCURRENT_RECORDINGS):
+            scheduler_service.remove_completed_session(i)
         
-        # Should now be able to start recording
-        assert scheduler_service._can_start_recording()
+        assert scheduler_service.active_sessions == {}
+        assert scheduler_service._try_acquire_slot()
     
-    def test_job_execution_callback(self, scheduler_service, sample_schedule):
+    def test_session_finished_during_start_not_tracked(self, scheduler_service, sample_schedule,
+                                                        sample_stream_config_data):
+        """Test a session that finishes before the start callback returns is not tracked."""
+        sample_schedule.stream_config = StreamConfiguration(**sample_stream_config_data)
+        
+        def finishing_callback(session_id, schedule, stream_config):
+            scheduler_service.remove_completed_session(session_id)
+            return Mock()
+        
+        scheduler_service.set_recording_start_callback(finishing_callback)
+        
+        with patch.object(scheduler_service.schedule_repo, 'get_with_config', return_value=sample_schedule), \
+             patch.object(scheduler_service.schedule_repo, 'record_run', return_value=123):
+            scheduler_service._execute_recording_job(sample_schedule.id)
+        
+        assert scheduler_service.active_sessions == {}
+        assert scheduler_service._slot_holders == set()
+    
+    def test_stop_all_sessions_releases_lock(self, scheduler_service):
+        """Test sessions are stopped without holding the sessions lock."""
+        lock_held = []
+        manager = Mock()
+        manager.stop_recording.side_effect = lambda: lock_held.append(scheduler_service._sessions_lock.locked())
+        scheduler_service.active_sessions[1] = manager
+        
+        scheduler_service._stop_all_active_sessions()
+        
+        assert lock_held == [False]
+        assert scheduler_service.active_sessions == {}
+    
+    def test_job_execution_callback(self, scheduler_service, sample_schedule, sample_stream_config_data):
         """Test job execution with callback."""
+        # get_with_config returns the schedule with its stream configuration loaded
+        sample_schedule.stream_config = StreamConfiguration(**sample_stream_config_data)
         scheduler_service.start()
         
         # Mock callback
@@ -198,9 +341,8 @@ class TestSchedulerService:
         scheduler_service.set_recording_start_callback(mock_callback)
         
         # Mock repositories to return test data
-        with patch.object(scheduler_service.schedule_repo, 'get_by_id', return_value=sample_schedule), \
-             patch.object(scheduler_service.config_repo, 'get_by_id', return_value=Mock()), \
-             patch.object(scheduler_service.session_repo, 'create', return_value=Mock(id=123)):
+        with patch.object(scheduler_service.schedule_repo, 'get_with_config', return_value=sample_schedule), \
+             patch.object(scheduler_service.schedule_repo, 'record_run', return_value=123):
             
             # Execute job directly
             scheduler_service._execute_recording_job(sample_schedule.id)
@@ -209,6 +351,45 @@ class TestSchedulerService:
             assert callback_called.wait(timeout=1.0)
             assert 'session_id' in callback_args
             assert callback_args['schedule'] == sample_schedule
+            assert callback_args['stream_config'] is sample_schedule.stream_config
+    
+    def test_job_execution_uses_local_time(self, scheduler_service, sample_schedule, sample_stream_config_data):
+        """Test the run is stamped with the configured local time, not the system clock."""
+        from src.utils.timezone_utils import localize_datetime
+        local_now = localize_datetime(datetime(2024, 1, 1, 0, 30, 0))
+        sample_schedule.stream_config = StreamConfiguration(**sample_stream_config_data)
+        scheduler_service.set_recording_start_callback(lambda session_id, schedule, stream_config: Mock())
+        
+        with patch('src.utils.timezone_utils.get_local_now', return_value=local_now), \
+             patch.object(scheduler_service.schedule_repo, 'get_with_config', return_value=sample_schedule), \
+             patch.object(scheduler_service.schedule_repo, 'record_run', return_value=123) as mock_record_run:
+            scheduler_service._execute_recording_job(sample_schedule.id)
+        
+        start_time = mock_record_run.call_args[0][1]
+        assert start_time == local_now
+        assert mock_record_run.call_args[1]['next_run_time'] == localize_datetime(datetime(2024, 1, 1, 1, 0, 0))
+    
+    def test_job_events_delivered_off_dispatch_thread(self, scheduler_service):
+        """Test job events reach the callback through the event thread."""
+        delivered = threading.Event()
+        received = {}
+        
+        def callback(event_type, data):
+            received['type'] = event_type
+            received['data'] = data
+            received['thread'] = threading.current_thread().name
+            delivered.set()
+        
+        scheduler_service.set_job_event_callback(callback)
+        scheduler_service.start()
+        
+        event = Mock(job_id="recording_schedule_1", scheduled_run_time=None)
+        scheduler_service._job_missed_listener(event)
+        
+        assert delivered.wait(timeout=1.0)
+        assert received['type'] == 'job_missed'
+        assert received['data']['job_id'] == "recording_schedule_1"
+        assert received['thread'] == "scheduler-job-events"
     
     def test_service_status(self, scheduler_service):
         """Test getting service status."""
@@ -223,6 +404,14 @@ class TestSchedulerService:
         assert status['running'] == False  # Not started yet
         assert status['active_sessions_count'] == 0
         assert status['max_concurrent_recordings'] == config.MAX_CONCURRENT_RECORDINGS
+        assert status['scheduled_jobs_count'] == 0
+    
+    def test_service_status_counts_recording_jobs(self, scheduler_service, sample_schedule):
+        """Test the job count excludes housekeeping jobs."""
+        scheduler_service.start()
+        scheduler_service.add_schedule(sample_schedule)
+        
+        assert scheduler_service.get_service_status()['scheduled_jobs_count'] == 1
 
 
 class TestJobManager: